@@ -6,9 +6,221 @@ Author: AutoSwing Team
 License: MIT
 """
 
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
 import ccxt
+import ccxt.async_support as ccxt_async
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from decouple import config
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    websockets = None
+
+# How long (seconds) account snapshots are reused before refetching
+BALANCE_CACHE_TTL = 3.0
+TICKERS_CACHE_TTL = 3.0
+
+# Cache size past which expired entries (e.g. one per priced token set) are swept
+CACHE_SWEEP_SIZE = 32
+
+# Most orders one batch request may carry (Binance batchOrders allows 5)
+BATCH_ORDER_LIMIT = 5
+
+# Binance request weight of the calls made here (spot API docs)
+WEIGHT_BALANCE = 20
+WEIGHT_TICKER = 2
+WEIGHT_TICKER_PRICES = 4
+WEIGHT_ALL_TICKERS = 80
+WEIGHT_ORDER = 1
+
+# Signed Binance requests are rejected if they arrive later than this (ms)
+RECV_WINDOW_MS = 5000
+
+# All-market mini ticker stream: every symbol's last price, pushed each second
+MINI_TICKER_STREAM_URL = "wss://stream.binance.com:9443/ws/!miniTicker@arr"
+
+# Last streamed price per Binance market id (e.g. 'BTCUSDT'). Only trusted
+# while _ticker_stream_live is set; the stream thread starts on first use.
+LAST_PRICE: Dict[str, float] = {}
+LAST_PRICE_LOCK = threading.Lock()
+_ticker_stream_live = threading.Event()
+_ticker_stream_thread: Optional[threading.Thread] = None
+
+# One CCXT instance per exchange id, shared by every CryptoExchange
+_INSTANCES: Dict[str, ccxt.Exchange] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+# Event loop that owns every async CCXT client; its thread starts on first use
+_io_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: rate tokens per `per` seconds, bursting to rate.
+    
+    Callers reserve tokens up front (the balance may go negative) and then
+    wait off the debt, so concurrent callers queue in arrival order.
+    """
+    
+    def __init__(self, rate: float, per: float):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.ts) * self.rate / self.per)
+        self.ts = now
+    
+    def _reserve(self, weight: float) -> float:
+        """Take weight tokens and return the seconds to wait for them."""
+        with self.lock:
+            self._refill()
+            self.tokens -= weight
+            return 0.0 if self.tokens >= 0 else -self.tokens * self.per / self.rate
+    
+    def acquire(self, weight: float = 1):
+        """Block until weight tokens are available."""
+        wait = self._reserve(weight)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, weight: float = 1):
+        """Async acquire(); sleeps without blocking the event loop."""
+        wait = self._reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def sync_used(self, used: float):
+        """Align with the server's count of tokens used in the current window."""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, self.rate - used)
+
+
+# Binance limits shared by every CryptoExchange in the process:
+# 1200 request weight per minute and 100 orders per 10 seconds
+WEIGHT_BUCKET = TokenBucket(1200, 60)
+ORDER_BUCKET = TokenBucket(100, 10)
+
+
+def _sync_weight(client):
+    """Resync WEIGHT_BUCKET from the last response's X-MBX-USED-WEIGHT-1M header."""
+    # The async client keeps headers in a plain dict, in the server's casing
+    headers = client.last_response_headers or {}
+    used = next((v for k, v in headers.items() if k.lower() == 'x-mbx-used-weight-1m'), None)
+    if used is not None:
+        WEIGHT_BUCKET.sync_used(float(used))
+
+
+async def _run_ticker_stream():
+    """Keep the mini ticker stream connected, updating LAST_PRICE."""
+    delay = 1
+    while True:
+        try:
+            async with websockets.connect(MINI_TICKER_STREAM_URL) as ws:
+                delay = 1
+                async for message in ws:
+                    updates = {d['s']: float(d['c']) for d in json.loads(message)}
+                    with LAST_PRICE_LOCK:
+                        LAST_PRICE.update(updates)
+                    _ticker_stream_live.set()
+        except Exception as err:
+            print(f"⚠️ Ticker stream disconnected: {err}")
+        _ticker_stream_live.clear()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 30)
+
+
+def start_ticker_stream() -> bool:
+    """
+    Start (once per process) the background Binance mini ticker stream.
+    
+    Returns:
+        True if the stream thread is running, False if websockets is missing
+    """
+    global _ticker_stream_thread
+    if not WEBSOCKETS_AVAILABLE:
+        return False
+    with _INSTANCES_LOCK:
+        if _ticker_stream_thread is None:
+            _ticker_stream_thread = threading.Thread(
+                target=lambda: asyncio.run(_run_ticker_stream()),
+                name="binance-tickers",
+                daemon=True,
+            )
+            _ticker_stream_thread.start()
+    return True
+
+
+def _owner_loop() -> asyncio.AbstractEventLoop:
+    """Start (once per process) the background loop that runs async CCXT calls."""
+    global _io_loop
+    with _INSTANCES_LOCK:
+        if _io_loop is None:
+            _io_loop = asyncio.new_event_loop()
+            threading.Thread(target=_io_loop.run_forever, name="ccxt-io", daemon=True).start()
+    return _io_loop
+
+
+def _on_owner_loop(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the owner loop from any thread or loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _owner_loop())
+
+
+def _preload_markets(client: ccxt.Exchange):
+    """Load market metadata in the background so the first call is fast."""
+    try:
+        client.load_markets()
+    except Exception as err:
+        print(f"⚠️ Market preload failed for {client.id}: {err}")
+
+
+def _http_session() -> requests.Session:
+    """
+    Build the pooled keep-alive session handed to a CCXT instance.
+    
+    The pool is sized for concurrent order placement, so every request
+    reuses a warm TLS connection. Only GETs are retried on gateway
+    errors: a retried POST could place an order twice, and 429s are
+    left to the token buckets.
+    """
+    session = requests.Session()
+    session.trust_env = False  # Same as CCXT's own default session
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({'GET'}),
+        ),
+    ))
+    return session
+
+
+def _shared_exchange(exchange_id: str, client_config: Dict) -> ccxt.Exchange:
+    """Return the process-wide CCXT instance for an exchange, creating it once."""
+    with _INSTANCES_LOCK:
+        client = _INSTANCES.get(exchange_id)
+        if client is None:
+            client = getattr(ccxt, exchange_id)({**client_config, 'session': _http_session()})
+            _INSTANCES[exchange_id] = client
+            threading.Thread(target=_preload_markets, args=(client,), daemon=True).start()
+        return client
 
 
 class CryptoExchange:
@@ -28,13 +240,134 @@ class CryptoExchange:
         self._api_key = config(f"{exchange_id.upper()}_API_KEY")
         self._api_secret = config(f"{exchange_id.upper()}_API_SECRET")
         
-        # Initialize CCXT exchange instance
-        exchange_class = getattr(ccxt, exchange_id)
-        self.client = exchange_class({
+        self._client_config = {
             'apiKey': self._api_key,
             'secret': self._api_secret,
             'enableRateLimit': True,
-        })
+        }
+        if exchange_id == 'binance':
+            # Tighter than ccxt's 10s default, applied to every signed call
+            self._client_config['options'] = {'recvWindow': RECV_WINDOW_MS}
+            # Prices for portfolio valuation come from the stream when live
+            start_ticker_stream()
+        
+        # Reuse the shared CCXT instance (markets load once per process)
+        self.client = _shared_exchange(exchange_id, self._client_config)
+        
+        # Async twin, created on first use. It and self._inflight are only
+        # touched from the process-wide owner loop (see _owner_loop), so
+        # its HTTP session never crosses event loops.
+        self._aclient = None
+        
+        # Short-lived response cache: key -> (value, expiry). Misses are
+        # filled on the owner loop, so concurrent misses on one key, from
+        # threads or coroutines alike, await the same in-flight task.
+        self._cache: Dict[str, tuple] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    @property
+    def aclient(self):
+        """
+        Lazily created ccxt.async_support client for concurrent calls.
+        
+        Only use it from coroutines running on the owner loop. It starts
+        with the shared sync client's markets, if those are loaded, so
+        it does not fetch exchangeInfo again.
+        """
+        if self._aclient is None:
+            exchange_class = getattr(ccxt_async, self.exchange_id)
+            self._aclient = exchange_class(self._client_config)
+            if self.client.markets:
+                self._aclient.set_markets(self.client.markets, self.client.currencies)
+        return self._aclient
+    
+    async def _load_markets_async(self):
+        """Load the async client's markets, sharing the sync client's copy."""
+        client = self.aclient
+        if not client.markets:
+            markets = await asyncio.to_thread(self.client.load_markets)
+            client.set_markets(markets, self.client.currencies)
+    
+    async def _close_aclient(self):
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+    
+    async def close_async(self):
+        """Close the async client's HTTP session, if one was opened."""
+        await asyncio.wrap_future(_on_owner_loop(self._close_aclient()))
+    
+    def _cache_get(self, key: str) -> Any:
+        """Return a cached value, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+    
+    def _cache_put(self, key: str, value: Any, ttl: float):
+        """Store a value for ttl seconds, sweeping expired entries once the cache grows."""
+        now = time.monotonic()
+        if len(self._cache) >= CACHE_SWEEP_SIZE:
+            for stale_key, (_, expiry) in list(self._cache.items()):
+                if expiry <= now:
+                    self._cache.pop(stale_key, None)
+        self._cache[key] = (value, now + ttl)
+    
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch() on a miss.
+        
+        A miss is handed to _cached_async on the owner loop, with fetch()
+        in a worker thread, so it shares one request with concurrent
+        sync and async callers of the same key. Never call from the
+        owner loop itself.
+        
+        Args:
+            key: Cache key
+            ttl: Seconds the fetched value stays valid
+            fetch: Zero-argument callable performing the request
+        """
+        value = self._cache_get(key)
+        if value is None:
+            value = _on_owner_loop(
+                self._cached_async(key, ttl, lambda: asyncio.to_thread(fetch))
+            ).result()
+        return value
+    
+    async def _cached_async(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Async counterpart of _cached(); fetch() must return an awaitable."""
+        value = self._cache_get(key)
+        if value is not None:
+            return value
+        
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        pending = asyncio.ensure_future(fetch())
+        self._inflight[key] = pending
+        try:
+            value = await pending
+            self._cache_put(key, value, ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    def _request(self, weight: float, call: Callable, *args, **kwargs) -> Any:
+        """Make a rate-limited sync client call costing weight."""
+        WEIGHT_BUCKET.acquire(weight)
+        try:
+            return call(*args, **kwargs)
+        finally:
+            _sync_weight(self.client)
+    
+    async def _request_async(self, weight: float, call: Callable, *args, **kwargs) -> Any:
+        """Make a rate-limited async client call costing weight."""
+        await WEIGHT_BUCKET.acquire_async(weight)
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            _sync_weight(self.aclient)
     
     def fetch_token_balance(self, token: str) -> Dict[str, float]:
         """
@@ -47,7 +380,11 @@ class CryptoExchange:
             Dictionary with 'available', 'locked', and 'total' balances
         """
         try:
-            all_balances = self.client.fetch_balance()
+            all_balances = self._cached(
+                "balance",
+                BALANCE_CACHE_TTL,
+                lambda: self._request(WEIGHT_BALANCE, self.client.fetch_balance)
+            )
             
             if token not in all_balances or 'free' not in all_balances[token]:
                 raise KeyError(f"Token {token} not found in account.")
@@ -60,36 +397,138 @@ class CryptoExchange:
         except Exception as err:
             raise Exception(f"Balance fetch failed: {str(err)}")
     
-    def calculate_portfolio_usdt(self) -> float:
+    async def _fetch_usdt_prices(self, tokens: List[str]) -> Dict[str, float]:
+        """
+        Fetch the last USDT price for each of the given tokens.
+        
+        On Binance this is a single /api/v3/ticker/price request limited to
+        the held symbols. Venues without that endpoint, or requests it
+        rejects, fall back to the full fetch_tickers() dump.
+        
+        Args:
+            tokens: Token symbols (e.g., ['BTC', 'ETH'])
+            
+        Returns:
+            Dictionary mapping token to last price; tokens without a
+            USDT market are omitted
+        """
+        client = self.aclient
+        pairs = {token: f"{token}/USDT" for token in tokens}
+        
+        if hasattr(client, 'publicGetTickerPrice'):
+            await self._load_markets_async()
+            market_ids = {
+                client.markets[pair]['id']: token
+                for token, pair in pairs.items()
+                if pair in client.markets
+            }
+            if not market_ids:
+                return {}
+            try:
+                response = await self._request_async(
+                    WEIGHT_TICKER_PRICES,
+                    client.publicGetTickerPrice,
+                    {'symbols': json.dumps(list(market_ids), separators=(',', ':'))}
+                )
+                return {
+                    market_ids[item['symbol']]: float(item['price'])
+                    for item in response
+                    if item['symbol'] in market_ids
+                }
+            except Exception as err:
+                print(f"⚠️ Batch price lookup failed, fetching all tickers: {err}")
+        
+        price_data = await self._request_async(WEIGHT_ALL_TICKERS, client.fetch_tickers)
+        return {
+            token: price_data[pair]['last']
+            for token, pair in pairs.items()
+            if pair in price_data and price_data[pair]['last']
+        }
+    
+    async def calculate_portfolio_usdt_async(self) -> float:
         """
         Calculate total portfolio value in USDT.
         
+        Only the held tokens are priced. On Binance their prices come
+        from the mini ticker stream while it is live; any token it lacks
+        is priced via one batched ticker request. Market metadata loads
+        concurrently with the balance request on a cold client, and both
+        balances and prices share the short-lived cache with
+        fetch_token_balance.
+        
+        Can be awaited from any event loop: the work runs on the owner
+        loop, which holds the async client.
+        
         Returns:
             Total portfolio value as float
         """
+        return await asyncio.wrap_future(_on_owner_loop(self._portfolio_usdt()))
+    
+    async def _portfolio_usdt(self) -> float:
+        """calculate_portfolio_usdt_async() body; runs on the owner loop."""
         try:
-            all_balances = self.client.fetch_balance()
-            price_data = self.client.fetch_tickers()
-            portfolio_value = 0.0
+            all_balances, _ = await asyncio.gather(
+                self._cached_async(
+                    "balance",
+                    BALANCE_CACHE_TTL,
+                    lambda: self._request_async(WEIGHT_BALANCE, self.aclient.fetch_balance)
+                ),
+                self._load_markets_async()
+            )
+            # Accounts list every asset ever touched; only value what is held
+            holdings = {
+                token: amount
+                for token, amount in all_balances['total'].items()
+                if amount > 0
+            }
+            held_tokens = sorted(holdings.keys() - {'USDT'})
             
-            for token, amount in all_balances['total'].items():
-                if amount <= 0:
-                    continue
-                    
-                if token == 'USDT':
-                    portfolio_value += amount
+            # Streamed prices first; only tokens it lacks go to REST
+            prices = {}
+            if _ticker_stream_live.is_set():
+                with LAST_PRICE_LOCK:
+                    for token in held_tokens:
+                        price = LAST_PRICE.get(f"{token}USDT")
+                        if price:
+                            prices[token] = price
+            missing = [token for token in held_tokens if token not in prices]
+            if missing:
+                prices.update(await self._cached_async(
+                    f"prices:{','.join(missing)}",
+                    TICKERS_CACHE_TTL,
+                    lambda: self._fetch_usdt_prices(missing)
+                ))
+            
+            portfolio_value = holdings.get('USDT', 0.0)
+            skipped = []
+            for token in held_tokens:
+                price = prices.get(token)
+                if price:
+                    portfolio_value += holdings[token] * price
                 else:
-                    pair = f"{token}/USDT"
-                    if pair in price_data and price_data[pair]['last']:
-                        portfolio_value += amount * price_data[pair]['last']
-                    else:
-                        print(f"⚠️ Skipping {token}: No price data available")
+                    skipped.append(token)
+            
+            if skipped:
+                print(f"⚠️ Skipping {', '.join(skipped)}: No price data available")
             
             return portfolio_value
             
         except Exception as err:
             raise Exception(f"Portfolio calculation failed: {str(err)}")
     
+    def calculate_portfolio_usdt(self) -> float:
+        """
+        Calculate total portfolio value in USDT.
+        
+        Synchronous wrapper around calculate_portfolio_usdt_async(). It
+        blocks on the owner loop, so the async client, its connections
+        and its markets are reused across calls and threads.
+        
+        Returns:
+            Total portfolio value as float
+        """
+        return _on_owner_loop(self._portfolio_usdt()).result()
+    
     def submit_order(
         self, 
         pair: str, 
@@ -115,13 +554,87 @@ class CryptoExchange:
             if order_type == 'limit':
                 if price is None:
                     raise ValueError("Limit orders require a price.")
-                return self.client.create_limit_order(pair, side, quantity, price)
+                ORDER_BUCKET.acquire(1)
+                return self._request(WEIGHT_ORDER, self.client.create_limit_order, pair, side, quantity, price)
             elif order_type == 'market':
-                return self.client.create_market_order(pair, side, quantity)
+                ORDER_BUCKET.acquire(1)
+                return self._request(WEIGHT_ORDER, self.client.create_market_order, pair, side, quantity)
             else:
                 raise ValueError(f"Unknown order type: {order_type}")
         except Exception as err:
             raise Exception(f"Order submission failed: {str(err)}")
+        finally:
+            # Any fill or reservation changes balances
+            self._cache.pop("balance", None)
+    
+    def _supports_batch_orders(self, pair: str) -> bool:
+        """Whether orders for this pair can go through ccxt create_orders."""
+        if not self.client.has.get('createOrders'):
+            return False
+        # Binance only batches derivatives orders; spot goes one by one
+        if self.exchange_id.startswith('binance'):
+            self.client.load_markets()
+            return bool(self.client.market(pair).get('contract'))
+        return True
+    
+    def submit_orders_batch(self, pair: str, orders: List[Dict]) -> List[Any]:
+        """
+        Submit several orders for one trading pair.
+        
+        Uses the exchange's batch endpoint (BATCH_ORDER_LIMIT orders per
+        request) where the market supports it, and falls back to one
+        submit_order call per order otherwise.
+        
+        Args:
+            pair: Trading pair (e.g., 'BTC/USDT')
+            orders: Dicts with 'type', 'side', 'amount' and, for limit
+                orders, 'price'
+            
+        Returns:
+            One entry per order, in order: the exchange's order response,
+            or the Exception that order failed with
+        """
+        try:
+            batched = self._supports_batch_orders(pair)
+        except Exception as err:
+            # e.g. ccxt.BadSymbol: every order fails the same way
+            return [Exception(f"Order submission failed: {str(err)}") for _ in orders]
+        
+        if not batched:
+            results = []
+            for order in orders:
+                try:
+                    results.append(self.submit_order(
+                        pair, order['type'], order['side'], order['amount'], order.get('price')
+                    ))
+                except Exception as err:
+                    results.append(err)
+            return results
+        
+        results = []
+        try:
+            for start in range(0, len(orders), BATCH_ORDER_LIMIT):
+                chunk = orders[start:start + BATCH_ORDER_LIMIT]
+                try:
+                    ORDER_BUCKET.acquire(len(chunk))
+                    responses = self._request(
+                        WEIGHT_ORDER * len(chunk),
+                        self.client.create_orders,
+                        [{'symbol': pair, **order} for order in chunk]
+                    )
+                except Exception as err:
+                    results.extend(Exception(f"Order submission failed: {str(err)}") for _ in chunk)
+                    continue
+                for response in responses:
+                    if response.get('status') == 'rejected':
+                        info = response.get('info') or {}
+                        results.append(Exception(f"Order submission failed: {info.get('msg', info)}"))
+                    else:
+                        results.append(response)
+            return results
+        finally:
+            # Any fill or reservation changes balances
+            self._cache.pop("balance", None)
     
     def get_current_price(self, pair: str) -> float:
         """
@@ -134,7 +647,7 @@ class CryptoExchange:
             Current price as float
         """
         try:
-            ticker = self.client.fetch_ticker(pair)
+            ticker = self._request(WEIGHT_TICKER, self.client.fetch_ticker, pair)
             return ticker['last']
         except Exception as err:
             raise Exception(f"Price fetch failed: {str(err)}")
@@ -0,0 +1,57 @@
+"""
+AutoSwing Grid Signal Kernel
+Compiled threshold replay for batch backtests of the grid strategy.
+"""
+
+import numpy as np
+
+# numba is optional and slow to import, so the kernel is compiled on the
+# first signals() call rather than when this module loads
+_kernel = None
+
+
+def _signals(prices: np.ndarray, ref0: float, buy_thr: float, sell_thr: float) -> np.ndarray:
+    out = np.zeros(prices.shape[0], dtype=np.int8)
+    buy_mult = 1.0 + buy_thr / 100.0
+    sell_mult = 1.0 + sell_thr / 100.0
+    buy_level = ref0 * buy_mult
+    sell_level = ref0 * sell_mult
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        if price <= buy_level:
+            out[i] = 1
+        elif price >= sell_level:
+            out[i] = -1
+        else:
+            continue
+        buy_level = price * buy_mult
+        sell_level = price * sell_mult
+    return out
+
+
+def signals(prices: np.ndarray, ref0: float, buy_thr: float, sell_thr: float) -> np.ndarray:
+    """
+    Replay grid buy/sell signals over a price series.
+    
+    Mirrors GridTrader.check_and_execute: the reference price moves to
+    the current price on every signal. Balances are not modelled, so
+    every signal is assumed to fill. Runs as plain Python if numba is
+    not installed.
+    
+    Args:
+        prices: 1-D float64 array of prices
+        ref0: Starting reference price
+        buy_thr: Buy threshold in percent (negative)
+        sell_thr: Sell threshold in percent (positive)
+    
+    Returns:
+        int8 array with +1 for a buy, -1 for a sell and 0 otherwise
+    """
+    global _kernel
+    if _kernel is None:
+        try:
+            from numba import njit
+            _kernel = njit(cache=True)(_signals)
+        except ImportError:
+            _kernel = _signals
+    return _kernel(prices, ref0, buy_thr, sell_thr)
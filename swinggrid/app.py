@@ -6,8 +6,10 @@ A Streamlit-based dashboard for simulated BTC/USDT grid trading on Binance testn
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import time
+from collections import deque
 from datetime import datetime
 import os
 import sys
@@ -24,10 +26,17 @@ from utils import (
     format_percentage,
     create_candlestick_chart,
     create_price_line_chart,
-    format_trade_for_display,
+    format_trade_log,
     get_trend_indicator,
 )
 
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False
+    st_autorefresh = None
+
 # Page configuration
 st.set_page_config(
     page_title="AutoSwing - Grid Trading Bot",
@@ -36,124 +45,32 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for dark fintech theme
-st.markdown("""
-<style>
-    /* Main theme */
-    .stApp {
-        background-color: #0E1117;
-    }
-    
-    /* Header styling */
-    .main-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 1rem 0;
-        border-bottom: 1px solid #333;
-        margin-bottom: 1rem;
-    }
-    
-    .main-title {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #FAFAFA;
-        margin: 0;
-    }
-    
-    .sandbox-badge {
-        background: linear-gradient(135deg, #FF6B6B 0%, #FF8E53 100%);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(145deg, #1a1a2e 0%, #16213e 100%);
-        border: 1px solid #333;
-        border-radius: 12px;
-        padding: 1.2rem;
-        text-align: center;
-        transition: transform 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-    }
-    
-    .metric-label {
-        color: #888;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-value {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #FAFAFA;
-    }
-    
-    .metric-value.profit {
-        color: #00D26A;
-    }
-    
-    .metric-value.loss {
-        color: #FF4B4B;
-    }
-    
-    /* Status indicator */
-    .status-running {
-        color: #00D26A;
-        font-weight: 600;
-    }
-    
-    .status-paused {
-        color: #FF4B4B;
-        font-weight: 600;
-    }
-    
-    /* Trade table styling */
-    .trade-buy {
-        color: #00D26A !important;
-        font-weight: 600;
-    }
-    
-    .trade-sell {
-        color: #FF4B4B !important;
-        font-weight: 600;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background-color: #1a1a2e;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        width: 100%;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Price display */
-    .price-display {
-        font-size: 2.5rem;
-        font-weight: 700;
-        text-align: center;
-        padding: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def load_css() -> str:
+    """Read the dashboard stylesheet once per server process."""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "style.css")
+    with open(css_path, encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+# Custom CSS for dark fintech theme. Streamlit drops elements a rerun does
+# not emit, so the block is re-sent each run, but read and built only once.
+st.markdown(load_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_binance_client(api_key, api_secret, use_mainnet: bool, use_binance_us: bool) -> BinanceTestnetClient:
+    """
+    Build one client per connection setting for the whole server process.
+    
+    Every browser session shares it, so there is a single trade stream,
+    background loop and HTTP pool however many tabs are open. While the
+    stream is live, get_current_price/fetch_all serve its latest price.
+    """
+    client = BinanceTestnetClient(api_key, api_secret, use_mainnet, use_binance_us)
+    client.start_price_stream(config.SYMBOL)
+    return client
 
 
 def init_session_state():
@@ -187,13 +104,13 @@ def init_session_state():
             use_mainnet = os.environ.get("USE_MAINNET_DATA", "False").lower() == "true"
             use_binance_us = os.environ.get("USE_BINANCE_US", "False").lower() == "true"
         
-        st.session_state.binance_client = BinanceTestnetClient(api_key, api_secret, use_mainnet, use_binance_us)
+        st.session_state.binance_client = get_binance_client(api_key, api_secret, use_mainnet, use_binance_us)
     
     if 'last_price' not in st.session_state:
         st.session_state.last_price = None
     
     if 'price_history' not in st.session_state:
-        st.session_state.price_history = []
+        st.session_state.price_history = deque(maxlen=config.PRICE_HISTORY_LIMIT)
     
     if 'chart_type' not in st.session_state:
         st.session_state.chart_type = "Candlestick"
@@ -209,27 +126,30 @@ def render_header():
     
     with col2:
         client = st.session_state.binance_client
-        is_live = getattr(client, 'use_mainnet', False)
-        status = getattr(client, 'connection_status', 'UNKNOWN')
-        error = getattr(client, 'last_error', None)
-
-        if is_live:
-            if status == "CONNECTED":
-                badge_html = '<span class="sandbox-badge" style="background: linear-gradient(135deg, #00C851 0%, #007E33 100%);">🟢 LIVE DATA</span>'
-            elif status == "RESTRICTED":
-                badge_html = f'<span class="sandbox-badge" style="background: #FF8800;">⚠️ RESTRICTED</span>'
-                st.toast(f"Connection Issue: {error}", icon="⚠️")
+        is_live = client.use_mainnet
+        status = client.connection_status
+        error = client.last_error
+        
+        # Rebuild the badge (and toast) only when the connection state changes
+        badge_key = (is_live, status, error)
+        if st.session_state.get('_badge_key') != badge_key:
+            if is_live:
+                if status == "CONNECTED":
+                    badge_html = '<span class="sandbox-badge" style="background: linear-gradient(135deg, #00C851 0%, #007E33 100%);">🟢 LIVE DATA</span>'
+                elif status == "RESTRICTED":
+                    badge_html = f'<span class="sandbox-badge" style="background: #FF8800;">⚠️ RESTRICTED</span>'
+                    st.toast(f"Connection Issue: {error}", icon="⚠️")
+                else:
+                    badge_html = f'<span class="sandbox-badge" style="background: #CC0000;">🔴 ERROR</span>'
+                    if error:
+                        st.toast(f"Connection Error: {error}", icon="❌")
             else:
-                badge_html = f'<span class="sandbox-badge" style="background: #CC0000;">🔴 ERROR</span>'
-                if error:
-                    st.toast(f"Connection Error: {error}", icon="❌")
-        else:
-            badge_html = '<span class="sandbox-badge">🔒 SANDBOX MODE</span>'
-
-        st.markdown(
-            f'<div style="text-align: right; padding-top: 0.5rem;">{badge_html}</div>',
-            unsafe_allow_html=True
-        )
+                badge_html = '<span class="sandbox-badge">🔒 SANDBOX MODE</span>'
+            
+            st.session_state['_badge_html'] = f'<div style="text-align: right; padding-top: 0.5rem;">{badge_html}</div>'
+            st.session_state['_badge_key'] = badge_key
+        
+        st.markdown(st.session_state['_badge_html'], unsafe_allow_html=True)
 
 
 def render_sidebar():
@@ -356,11 +276,8 @@ def render_metrics(current_price: float, stats: dict):
         )
 
 
-def render_price_chart(client: BinanceTestnetClient, chart_type: str):
+def render_price_chart(df: pd.DataFrame, chart_type: str):
     """Render the price chart."""
-    # Fetch kline data
-    df = client.get_klines(config.SYMBOL, config.KLINE_INTERVAL, config.KLINE_LIMIT)
-    
     if chart_type == "Candlestick":
         fig = create_candlestick_chart(df, "BTC/USDT")
     else:
@@ -396,6 +313,18 @@ def render_current_price(current_price: float, last_price: float):
         )
 
 
+# Trade log cell styles, built once from the theme colors
+TRADE_TYPE_STYLES = {
+    "BUY": f'color: {config.COLORS["profit"]}; font-weight: 600',
+    "SELL": f'color: {config.COLORS["loss"]}; font-weight: 600',
+}
+PNL_PROFIT_STYLE = f'color: {config.COLORS["profit"]}'
+PNL_LOSS_STYLE = f'color: {config.COLORS["loss"]}'
+
+# Visible trade log columns; 'P&L_num' only feeds the styling
+TRADE_LOG_COLUMNS = ["Time", "Type", "Price", "Amount", "Value", "P&L"]
+
+
 def render_trade_log(trades: list):
     """Render the trade log table."""
     st.markdown("### 📋 Recent Trades")
@@ -405,34 +334,28 @@ def render_trade_log(trades: list):
         return
     
     # Format trades for display
-    formatted_trades = [format_trade_for_display(t) for t in trades]
-    df = pd.DataFrame(formatted_trades)
-    
-    # Apply styling
-    def style_trade_type(val):
-        if val == "BUY":
-            return f'color: {config.COLORS["profit"]}; font-weight: 600'
-        elif val == "SELL":
-            return f'color: {config.COLORS["loss"]}; font-weight: 600'
-        return ''
-    
-    def style_pnl(val):
-        if val != "—":
-            try:
-                # Extract numeric value
-                num = float(val.replace('$', '').replace(',', '').replace('-', ''))
-                if '-' in val:
-                    return f'color: {config.COLORS["loss"]}'
-                elif num > 0:
-                    return f'color: {config.COLORS["profit"]}'
-            except:
-                pass
-        return ''
-    
-    styled_df = df.style.applymap(style_trade_type, subset=['Type'])
-    styled_df = styled_df.applymap(style_pnl, subset=['P&L'])
-    
-    st.dataframe(styled_df, use_container_width=True, hide_index=True)
+    df = format_trade_log(trades)
+    
+    # One vectorized pass per styled column instead of a call per cell;
+    # P&L colors come from the numeric helper column, not display strings
+    def style_type(col):
+        return np.where(
+            col == "BUY", TRADE_TYPE_STYLES["BUY"],
+            np.where(col == "SELL", TRADE_TYPE_STYLES["SELL"], '')
+        )
+    
+    pnl = df['P&L_num'].to_numpy()
+    pnl_styles = np.where(pnl < 0, PNL_LOSS_STYLE, np.where(pnl > 0, PNL_PROFIT_STYLE, ''))
+    
+    styled_df = df.style.apply(style_type, subset=['Type'])
+    styled_df = styled_df.apply(lambda _: pnl_styles, subset=['P&L'])
+    
+    st.dataframe(
+        styled_df,
+        use_container_width=True,
+        hide_index=True,
+        column_order=TRADE_LOG_COLUMNS,
+    )
 
 
 def render_bot_stats(stats: dict, current_price: float):
@@ -466,9 +389,15 @@ def main():
     # Render sidebar and get refresh interval
     refresh_interval = render_sidebar()
     
-    # Get current price
+    # Schedule the next tick from the browser instead of sleeping here
+    if st.session_state.bot_running and AUTOREFRESH_AVAILABLE:
+        st_autorefresh(interval=refresh_interval * 1000, key="tick")
+    
+    # Fetch price and candles concurrently (cached candles are reused)
     client = st.session_state.binance_client
-    current_price = client.get_current_price()
+    current_price, klines = client.fetch_all(
+        config.SYMBOL, config.KLINE_INTERVAL, config.KLINE_LIMIT
+    )
     last_price = st.session_state.last_price
     
     # Execute trading logic if bot is running
@@ -486,18 +415,18 @@ def main():
     # Main content area
     st.markdown("---")
     
-    # Current price display
-    render_current_price(current_price, last_price)
-    
-    st.markdown("")
-    
-    # Portfolio metrics
-    render_metrics(current_price, stats)
+    # Price and portfolio metrics share one container so each tick
+    # rewrites that subtree in place
+    live_panel = st.empty()
+    with live_panel.container():
+        render_current_price(current_price, last_price)
+        st.markdown("")
+        render_metrics(current_price, stats)
     
     st.markdown("---")
     
     # Price chart
-    render_price_chart(client, st.session_state.chart_type)
+    render_price_chart(klines, st.session_state.chart_type)
     
     st.markdown("---")
     
@@ -513,8 +442,8 @@ def main():
     # Update last price
     st.session_state.last_price = current_price
     
-    # Auto-refresh when bot is running
-    if st.session_state.bot_running:
+    # Without streamlit-autorefresh, fall back to a blocking refresh loop
+    if st.session_state.bot_running and not AUTOREFRESH_AVAILABLE:
         time.sleep(refresh_interval)
         st.rerun()
 
@@ -4,20 +4,131 @@ Connects to Binance testnet for real-time price data.
 """
 
 import os
+import json
+import atexit
+import importlib.util
+import time
+import pickle
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 
+# python-binance is only imported when a keyed client is built (see __init__),
+# so the REST-only dashboard never pays for its import
+BINANCE_AVAILABLE = importlib.util.find_spec("binance") is not None
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    websockets = None
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+# orjson decodes REST and stream payloads from bytes several times faster than stdlib json
 try:
-    from binance.client import Client
-    from binance.exceptions import BinanceAPIException
-    BINANCE_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    BINANCE_AVAILABLE = False
-    Client = None
-    BinanceAPIException = Exception
+    _json_loads = json.loads
+
+# Columns returned by get_klines; Binance rows carry six more we never use
+KLINE_COLUMNS = ['time', 'open', 'high', 'low', 'close', 'volume']
+
+# Seconds per kline interval unit ('1m' -> 60, '4h' -> 14400, '1M' ~ 30 days)
+INTERVAL_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'M': 2592000}
+
+
+class _TTLCache:
+    """
+    Minimal in-process cache of {key: (expires_at, value)} on time.monotonic().
+
+    Given a Redis client, entries are also shared with every other process
+    and Streamlit session using the same Redis. The local dict is checked
+    first; Redis errors fall back to local-only caching for a while.
+    """
+
+    REDIS_RETRY_SECONDS = 30
+
+    def __init__(self, redis_client=None, namespace: str = ""):
+        self._entries: Dict[tuple, tuple] = {}
+        self._redis = redis_client
+        self._namespace = namespace
+        self._redis_retry_at = 0.0
+
+    def _redis_key(self, key: tuple) -> str:
+        return ":".join(map(str, ("binance", self._namespace) + key))
+
+    def _redis_usable(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, e: Exception):
+        print(f"Redis cache unavailable, using local cache only: {e}")
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+
+    def get(self, key: tuple):
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        if not self._redis_usable():
+            return None
+
+        try:
+            raw = self._redis.get(self._redis_key(key))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+        if raw is None:
+            return None
+
+        # Redis entries carry their wall-clock expiry so the local copy
+        # expires at the same moment in every process
+        expires_at, value = pickle.loads(raw)
+        remaining = expires_at - time.time()
+        if remaining > 0:
+            self._entries[key] = (time.monotonic() + remaining, value)
+        return value
+
+    def set(self, key: tuple, value, ttl: float):
+        """Store a value for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        if not self._redis_usable():
+            return
+
+        try:
+            self._redis.set(
+                self._redis_key(key),
+                pickle.dumps((time.time() + ttl, value), protocol=pickle.HIGHEST_PROTOCOL),
+                px=max(1, int(ttl * 1000)),
+            )
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def invalidate(self):
+        """Drop every local entry (shared Redis entries expire on their own)."""
+        self._entries.clear()
 
 
 class BinanceClientWrapper:
@@ -44,18 +155,64 @@ class BinanceClientWrapper:
         # Determine Base URL
         if not use_mainnet:
             self.base_url = config.TESTNET_BASE_URL
+            self.ws_url = config.TESTNET_WS_URL
         elif use_binance_us:
             self.base_url = config.BINANCE_US_BASE_URL
+            self.ws_url = config.BINANCE_US_WS_URL
         else:
             self.base_url = config.MAINNET_BASE_URL
+            self.ws_url = config.MAINNET_WS_URL
             
         self.client = None
         self.connection_status = "INITIALIZING"
         self.last_error = None
         
+        # Shared HTTP session so REST fallbacks reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'AutoSwing/1.0',
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        ))
+        
+        # Market data cache; only successful API responses are stored.
+        # Set REDIS_URL to share it across sessions (trusted Redis only:
+        # entries are pickled).
+        redis_url = os.getenv("REDIS_URL")
+        redis_client = None
+        if REDIS_AVAILABLE and redis_url:
+            redis_client = redis.Redis.from_url(
+                redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+        self._cache = _TTLCache(redis_client, namespace=self.base_url.split("//")[-1])
+        
+        # Worker threads for fetch_bundle, created on first use
+        self._pool = None
+        
+        # Guards the lazy pool/loop/stream setup: one instance may be shared
+        # by every dashboard session (see app.get_binance_client)
+        self._init_lock = threading.RLock()
+        
+        # xorshift64 state for simulated fallback prices (must be non-zero)
+        self._rng_state = time.monotonic_ns() | 1
+        
+        # Live price stream (see start_price_stream); the Event is set
+        # only while the socket is connected and has delivered a price
+        self._loop = None
+        self._aio_session = None
+        self._stream_symbol = None
+        self._stream_price = None
+        self._stream_live = threading.Event()
+        self._stream_listener = None
+        
         # Initialize python-binance client if keys provided and library available
         if BINANCE_AVAILABLE and api_key and api_secret:
             try:
+                from binance.client import Client
                 self.client = Client(
                     api_key=api_key,
                     api_secret=api_secret,
@@ -85,31 +242,19 @@ class BinanceClientWrapper:
         Returns:
             Current price as float
         """
+        streamed = self._streamed_price(symbol)
+        if streamed is not None:
+            return streamed
+        
         try:
             if self.client:
                 ticker = self.client.get_symbol_ticker(symbol=symbol)
                 return float(ticker['price'])
             else:
                 # Fallback to REST API
-                response = requests.get(
-                    f"{self.base_url}/api/v3/ticker/price",
-                    params={"symbol": symbol},
-                    timeout=10
-                )
-                if response.status_code == 451: # Geo-restriction
-                     self.last_error = "Geo-Restricted (451)"
-                     self.connection_status = "RESTRICTED"
-                     print("Warning: Geo-restricted. Using simulated data.")
-                     return self._generate_simulated_price()
-                
-                response.raise_for_status()
-                self.connection_status = "CONNECTED" # Success via REST
-                return float(response.json()['price'])
+                return self._price_from(self._get_json_sync("/api/v3/ticker/price", {"symbol": symbol}))
         except Exception as e:
-            self.last_error = f"Fetch Error: {str(e)}"
-            self.connection_status = "ERROR"
-            print(f"Error fetching price: {e}")
-            return self._generate_simulated_price()
+            return self._price_failed(e)
     
     def get_klines(self, symbol: str = "BTCUSDT", interval: str = "1m", limit: int = 60) -> pd.DataFrame:
         """
@@ -123,6 +268,11 @@ class BinanceClientWrapper:
         Returns:
             DataFrame with OHLCV data
         """
+        cache_key = ("klines", symbol, interval, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             if self.client:
                 klines = self.client.get_klines(
@@ -132,41 +282,13 @@ class BinanceClientWrapper:
                 )
             else:
                 # Fallback to REST API
-                response = requests.get(
-                    f"{self.base_url}/api/v3/klines",
-                    params={
-                        "symbol": symbol,
-                        "interval": interval,
-                        "limit": limit
-                    },
-                    timeout=10
+                klines = self._get_json_sync(
+                    "/api/v3/klines",
+                    {"symbol": symbol, "interval": interval, "limit": limit}
                 )
-                if response.status_code == 451:
-                     return self._generate_demo_klines(limit)
-
-                response.raise_for_status()
-                klines = response.json()
-            
-            # Parse klines into DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            df['time'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            return df[['time', 'open', 'high', 'low', 'close', 'volume']]
-            
+            return self._klines_from(klines, cache_key, interval, limit)
         except Exception as e:
-            print(f"Error fetching klines: {e}")
-            # Return simulated data for demo
-            return self._generate_demo_klines(limit)
+            return self._klines_failed(e, limit)
     
     def get_24h_stats(self, symbol: str = "BTCUSDT") -> Dict:
         """
@@ -178,105 +300,393 @@ class BinanceClientWrapper:
         Returns:
             Dictionary with 24h stats
         """
+        cache_key = ("24h", symbol)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             if self.client:
                 stats = self.client.get_ticker(symbol=symbol)
             else:
-                response = requests.get(
-                    f"{self.base_url}/api/v3/ticker/24hr",
-                    params={"symbol": symbol},
-                    timeout=10
-                )
-                if response.status_code == 451:
-                     return {
-                        "price_change": 0, "price_change_percent": 0,
-                        "high": 0, "low": 0, "volume": 0, "quote_volume": 0
-                     }
-
-                response.raise_for_status()
-                stats = response.json()
+                stats = self._get_json_sync("/api/v3/ticker/24hr", {"symbol": symbol})
+                if stats is None:
+                    return self._empty_24h_stats()
             
-            return {
-                "price_change": float(stats.get('priceChange', 0)),
-                "price_change_percent": float(stats.get('priceChangePercent', 0)),
-                "high": float(stats.get('highPrice', 0)),
-                "low": float(stats.get('lowPrice', 0)),
-                "volume": float(stats.get('volume', 0)),
-                "quote_volume": float(stats.get('quoteVolume', 0)),
-            }
+            parsed = self._parse_24h_stats(stats)
+            self._cache.set(cache_key, parsed, config.STATS_CACHE_TTL)
+            return parsed
         except Exception as e:
             print(f"Error fetching 24h stats: {e}")
-            return {
-                "price_change": 0,
-                "price_change_percent": 0,
-                "high": 0,
-                "low": 0,
-                "volume": 0,
-                "quote_volume": 0,
-            }
+            return self._empty_24h_stats()
+
+    def fetch_all(self, symbol: str = "BTCUSDT", interval: str = "1m", limit: int = 60) -> Tuple[float, pd.DataFrame]:
+        """
+        Blocking entry point for refresh_all.
+        
+        The coroutine runs on the client's background event loop, so the
+        aiohttp connection pool outlives each call (asyncio.run would
+        tear it down on every dashboard rerun).
+        
+        Returns:
+            Tuple of (current price, klines DataFrame)
+        """
+        if not AIOHTTP_AVAILABLE:
+            return self.fetch_bundle(symbol, interval, limit)
+        future = asyncio.run_coroutine_threadsafe(
+            self.refresh_all(symbol, interval, limit), self._ensure_loop()
+        )
+        return future.result(timeout=30)
+
+    def fetch_bundle(self, symbol: str = "BTCUSDT", interval: str = "1m", limit: int = 60) -> Tuple[float, pd.DataFrame]:
+        """
+        Fetch price and klines on a small thread pool.
+        
+        requests releases the GIL while waiting on the socket, so the
+        two sync getters overlap over the shared keep-alive session.
+        fetch_all uses this when aiohttp is not installed.
+        
+        Returns:
+            Tuple of (current price, klines DataFrame)
+        """
+        with self._init_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="binance-rest")
+        price = self._pool.submit(self.get_current_price, symbol)
+        klines = self._pool.submit(self.get_klines, symbol, interval, limit)
+        return price.result(), klines.result()
+
+    async def refresh_all(self, symbol: str = "BTCUSDT", interval: str = "1m", limit: int = 60) -> Tuple[float, pd.DataFrame]:
+        """
+        Fetch price and klines in one go.
+        
+        The REST requests are issued concurrently over one pooled aiohttp
+        session, so a refresh costs roughly one round trip instead of
+        two. Cached klines are served without a request.
+        Must run on the client's loop; use fetch_all from sync code.
+        
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval (1m, 5m, 15m, 1h, etc.)
+            limit: Number of candles to fetch (max 1000)
+        
+        Returns:
+            Tuple of (current price, klines DataFrame)
+        """
+        price, klines = await asyncio.gather(
+            self._get_price_async(symbol),
+            self._get_klines_async(symbol, interval, limit),
+        )
+        return price, klines
+
+    def start_price_stream(self, symbol: str = "BTCUSDT", on_tick: Optional[Callable[[float], None]] = None) -> bool:
+        """
+        Subscribe to the live trade stream for a symbol.
+        
+        Runs stream_prices on the client's background event loop. While
+        the socket is up, get_current_price returns the last pushed trade
+        price without any HTTP request; on disconnect it falls back to
+        REST and the stream reconnects with backoff.
+        
+        Args:
+            symbol: Trading pair symbol
+            on_tick: Optional callback for every trade price; it runs on
+                the background thread, so it must be thread-safe
+                (e.g. deque.append)
+        
+        Returns:
+            True if the stream is running, False if websockets is missing
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            return False
+        with self._init_lock:
+            if self._stream_symbol is None:
+                self._stream_symbol = symbol
+                self._stream_listener = on_tick
+                asyncio.run_coroutine_threadsafe(
+                    self.stream_prices(symbol, self._record_stream_price, self._stream_live.clear),
+                    self._ensure_loop(),
+                )
+        return self._stream_symbol == symbol
+
+    @property
+    def is_streaming(self) -> bool:
+        """True while the price stream is connected and delivering trades."""
+        return self._stream_live.is_set()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start (once) the background event loop for streaming and async REST.
+        
+        close() is registered to run at interpreter exit, so the stream,
+        the aiohttp session and the loop thread are released even if the
+        owner never calls it.
+        """
+        with self._init_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="binance-io", daemon=True).start()
+                atexit.register(self.close)
+            return self._loop
+
+    async def stream_prices(
+        self,
+        symbol: str,
+        on_tick: Callable[[float], None],
+        on_disconnect: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Push every trade price for a symbol to a callback, forever.
+        
+        Connects to the exchange's trade WebSocket and reconnects with
+        exponential backoff (capped at 30s). Cancel the task to stop.
+        
+        Args:
+            symbol: Trading pair symbol
+            on_tick: Called with each trade price as a float
+            on_disconnect: Called whenever the socket drops
+        """
+        url = f"{self.ws_url}/{symbol.lower()}@trade"
+        delay = 1
+        while True:
+            try:
+                async with websockets.connect(url) as ws:
+                    delay = 1
+                    async for message in ws:
+                        on_tick(float(_json_loads(message)['p']))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Price stream disconnected: {e}")
+            if on_disconnect is not None:
+                on_disconnect()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+
+    def _record_stream_price(self, price: float):
+        """on_tick handler for the client's own stream (see start_price_stream)."""
+        self._stream_price = price
+        if not self._stream_live.is_set():
+            self.connection_status = "CONNECTED"
+            self._stream_live.set()
+        if self._stream_listener is not None:
+            self._stream_listener(price)
+
+    async def _get_json(self, path: str, params: Dict):
+        """
+        GET a REST path on the pooled aiohttp session.
+        
+        Returns:
+            Decoded JSON body, or None if the endpoint is geo-restricted (451)
+        """
+        # Only ever runs on the client's single loop, and nothing is awaited
+        # between the check and the assignment, so no lock is needed
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={'User-Agent': 'AutoSwing/1.0'},
+            )
+        async with self._aio_session.get(f"{self.base_url}{path}", params=params) as response:
+            if response.status == 451:
+                return None
+            response.raise_for_status()
+            return _json_loads(await response.read())
+
+    async def _get_price_async(self, symbol: str) -> float:
+        """Async REST version of get_current_price."""
+        streamed = self._streamed_price(symbol)
+        if streamed is not None:
+            return streamed
+        
+        try:
+            return self._price_from(await self._get_json("/api/v3/ticker/price", {"symbol": symbol}))
+        except Exception as e:
+            return self._price_failed(e)
+
+    async def _get_klines_async(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """Async REST version of get_klines."""
+        cache_key = ("klines", symbol, interval, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            klines = await self._get_json(
+                "/api/v3/klines",
+                {"symbol": symbol, "interval": interval, "limit": limit}
+            )
+            return self._klines_from(klines, cache_key, interval, limit)
+        except Exception as e:
+            return self._klines_failed(e, limit)
+
+    def _get_json_sync(self, path: str, params: Dict):
+        """
+        GET a REST path on the pooled requests session.
+        
+        Returns:
+            Decoded JSON body, or None if the endpoint is geo-restricted (451)
+        """
+        response = self._session.get(f"{self.base_url}{path}", params=params, timeout=10)
+        if response.status_code == 451:
+            return None
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _streamed_price(self, symbol: str) -> Optional[float]:
+        """Last streamed trade price, or None if the stream is not live for symbol."""
+        if self._stream_live.is_set() and symbol == self._stream_symbol:
+            return self._stream_price
+        return None
+
+    def _price_from(self, data: Optional[Dict]) -> float:
+        """Turn a REST ticker body (None if geo-restricted) into a price."""
+        if data is None:
+            self.last_error = "Geo-Restricted (451)"
+            self.connection_status = "RESTRICTED"
+            print("Warning: Geo-restricted. Using simulated data.")
+            return self._generate_simulated_price()
+        
+        self.connection_status = "CONNECTED"  # Success via REST
+        return float(data['price'])
+
+    def _price_failed(self, e: Exception) -> float:
+        """Record a failed price fetch and return a simulated price."""
+        self.last_error = f"Fetch Error: {str(e)}"
+        self.connection_status = "ERROR"
+        print(f"Error fetching price: {e}")
+        return self._generate_simulated_price()
+
+    def _klines_from(self, klines: Optional[List], cache_key: tuple, interval: str, limit: int) -> pd.DataFrame:
+        """Parse and cache raw klines; None (geo-restricted) gives demo data."""
+        if klines is None:
+            return self._generate_demo_klines(limit)
+        
+        df = self._parse_klines(klines)
+        self._cache.set(cache_key, df, self._kline_ttl(interval))
+        return df
+
+    def _klines_failed(self, e: Exception, limit: int) -> pd.DataFrame:
+        """Log a failed klines fetch and return demo data."""
+        print(f"Error fetching klines: {e}")
+        return self._generate_demo_klines(limit)
+
+    def _kline_ttl(self, interval: str) -> float:
+        """Seconds until the current candle of this interval closes."""
+        try:
+            period = int(interval[:-1]) * INTERVAL_UNIT_SECONDS[interval[-1]]
+        except (KeyError, ValueError):
+            period = 60
+        return period - (time.time() % period)
+
+    def _parse_klines(self, klines: List) -> pd.DataFrame:
+        """Convert raw Binance kline rows into an OHLCV DataFrame."""
+        if not klines:
+            return pd.DataFrame(columns=KLINE_COLUMNS)
+        
+        # Read open time + OHLCV straight into typed arrays; close_time,
+        # quote_volume, trades, taker_buy_* and ignore are never touched,
+        # and no object-dtype intermediate is built
+        ts = np.fromiter((k[0] for k in klines), dtype=np.int64, count=len(klines))
+        ohlcv = np.array([k[1:6] for k in klines], dtype=np.float64)
+        
+        # Hand the float64 block to pandas as-is; copy=False keeps it
+        # zero-copy under Copy-on-Write (pandas 3 copies ndarrays by default)
+        df = pd.DataFrame(ohlcv, columns=KLINE_COLUMNS[1:], copy=False)
+        # Open times are int64 epoch ms: reinterpret, then one cast to ns
+        df.insert(0, 'time', ts.view('datetime64[ms]').astype('datetime64[ns]'))
+        return df
+
+    def _parse_24h_stats(self, stats: Dict) -> Dict:
+        """Convert a raw Binance 24hr ticker into the stats dictionary."""
+        return {
+            "price_change": float(stats.get('priceChange', 0)),
+            "price_change_percent": float(stats.get('priceChangePercent', 0)),
+            "high": float(stats.get('highPrice', 0)),
+            "low": float(stats.get('lowPrice', 0)),
+            "volume": float(stats.get('volume', 0)),
+            "quote_volume": float(stats.get('quoteVolume', 0)),
+        }
+
+    def _empty_24h_stats(self) -> Dict:
+        """Zeroed stats used when the API is unavailable."""
+        return {
+            "price_change": 0,
+            "price_change_percent": 0,
+            "high": 0,
+            "low": 0,
+            "volume": 0,
+            "quote_volume": 0,
+        }
 
     def _generate_simulated_price(self) -> float:
         """Generate a simulated price for fallback."""
-        return 42000.0 + (hash(str(datetime.now())) % 2000 - 1000)
+        x = self._rng_state
+        x ^= (x << 13) & 0xFFFFFFFFFFFFFFFF
+        x ^= x >> 7
+        x ^= (x << 17) & 0xFFFFFFFFFFFFFFFF
+        self._rng_state = x
+        # Top 11 bits -> offset in [-1024, 1023]
+        return 42000.0 + ((x >> 53) - 1024)
 
     def _generate_demo_klines(self, limit: int) -> pd.DataFrame:
         """Generate demo candlestick data when API is unavailable."""
-        import random
-        from datetime import timedelta
-        import math
-        
         base_price = 42000.0
         now = datetime.now()
         
         # Seed for reproducibility within the minute
-        random.seed(int(now.timestamp()) % 1000)
+        rng = np.random.default_rng(int(now.timestamp()) % 1000)
         
-        # Generate times and prices using pure Python
-        time_list = []
-        open_list = []
-        high_list = []
-        low_list = []
-        close_list = []
-        volume_list = []
+        # Random walk for price, then OHLCV around it, all as whole arrays
+        price = base_price * np.exp(np.cumsum(rng.normal(0, 0.001, limit)))
+        volatility = price * 0.002
+        open_p = price + rng.normal(0, volatility)
+        close_p = price + rng.normal(0, volatility)
+        high_p = np.maximum(open_p, close_p) + np.abs(rng.normal(0, volatility))
+        low_p = np.minimum(open_p, close_p) - np.abs(rng.normal(0, volatility))
+        volume = rng.uniform(10, 100, limit)
         
-        current_price = base_price
-        
-        for i in range(limit):
-            # Time for this candle
-            t = now - timedelta(minutes=limit - i - 1)
-            
-            # Random walk for price
-            change = random.gauss(0, 0.001)
-            current_price = current_price * math.exp(change)
-            
-            # Generate OHLCV data
-            volatility = current_price * 0.002
-            open_p = current_price + random.gauss(0, volatility)
-            close_p = current_price + random.gauss(0, volatility)
-            high_p = max(open_p, close_p) + abs(random.gauss(0, volatility))
-            low_p = min(open_p, close_p) - abs(random.gauss(0, volatility))
-            volume = random.uniform(10, 100)
-            
-            time_list.append(t)
-            open_list.append(open_p)
-            high_list.append(high_p)
-            low_list.append(low_p)
-            close_list.append(close_p)
-            volume_list.append(volume)
-        
-        # Create DataFrame column by column
-        df = pd.DataFrame()
-        df['time'] = time_list
-        df['open'] = open_list
-        df['high'] = high_list
-        df['low'] = low_list
-        df['close'] = close_list
-        df['volume'] = volume_list
-        
-        return df
+        return pd.DataFrame({
+            'time': pd.date_range(end=now, periods=limit, freq="min"),
+            'open': open_p,
+            'high': high_p,
+            'low': low_p,
+            'close': close_p,
+            'volume': volume,
+        })
+
+    def invalidate_cache(self):
+        """Drop cached klines and stats so the next calls hit the API."""
+        self._cache.invalidate()
+
+    def close(self):
+        """Stop the price stream and release HTTP sessions and worker threads."""
+        atexit.unregister(self.close)
+        with self._init_lock:
+            if self._loop is not None:
+                asyncio.run_coroutine_threadsafe(self._close_async(), self._loop).result(timeout=5)
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                self._stream_symbol = None
+                self._stream_live.clear()
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+        self._session.close()
+
+    async def _close_async(self):
+        """Cancel background tasks and close the aiohttp session on its own loop."""
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is not current:
+                task.cancel()
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
 
     def test_connection(self) -> bool:
         """Test if the API connection is working."""
+        self.invalidate_cache()
         try:
             self.get_current_price()
             return True
@@ -19,13 +19,22 @@ TRADE_AMOUNT_USDT = 100.0
 # Minimum trade amount in BTC
 MIN_TRADE_BTC = 0.0001
 
+# Maximum number of trades kept in the simulator's history (oldest dropped first)
+MAX_TRADE_HISTORY = 10_000
+
 # Refresh interval in seconds
 DEFAULT_REFRESH_INTERVAL = 15
 
+# Maximum number of ticks kept in the session's price history
+PRICE_HISTORY_LIMIT = 500
+
 # Chart settings
 KLINE_INTERVAL = "1m"  # 1-minute candles
 KLINE_LIMIT = 60  # Last 60 candles
 
+# Seconds 24h ticker stats are reused (klines are cached until their candle closes)
+STATS_CACHE_TTL = 5
+
 # Binance Testnet API endpoints
 # Binance Testnet API endpoints (Default)
 TESTNET_BASE_URL = "https://testnet.binance.vision"
@@ -6,7 +6,9 @@ Simulated grid trading logic for the dashboard.
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
+import numpy as np
 import config
+from _grid_numba import signals as replay_signals
 
 
 @dataclass
@@ -20,6 +22,103 @@ class Trade:
     pnl: Optional[float] = None  # Profit/Loss for sells
 
 
+class TradeLog:
+    """
+    Columnar (struct-of-arrays) trade history.
+    
+    Each Trade field lives in its own NumPy array that doubles when full,
+    up to max_size. From then on it is a ring buffer: new trades overwrite
+    the oldest, so memory stays bounded in long sessions.
+    """
+    
+    def __init__(self, capacity: int = 64, max_size: int = config.MAX_TRADE_HISTORY):
+        self._max_size = max_size
+        capacity = min(capacity, max_size)
+        self._n = 0  # Trades currently stored
+        self._start = 0  # Slot of the oldest stored trade
+        self._total = 0  # Trades ever appended
+        self._time = np.empty(capacity, dtype='datetime64[us]')
+        self._type = np.empty(capacity, dtype='U4')
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._amount = np.empty(capacity, dtype=np.float64)
+        self._value = np.empty(capacity, dtype=np.float64)
+        self._pnl = np.empty(capacity, dtype=np.float64)  # NaN = no P&L (buys)
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    @property
+    def total(self) -> int:
+        """Number of trades ever recorded, including dropped ones."""
+        return self._total
+    
+    def _grow(self):
+        """Double the capacity of every column (capped at max_size)."""
+        size = min(len(self._price) * 2, self._max_size)
+        for name in ('_time', '_type', '_price', '_amount', '_value', '_pnl'):
+            column = getattr(self, name)
+            grown = np.empty(size, dtype=column.dtype)
+            grown[:self._n] = column[:self._n]
+            setattr(self, name, grown)
+    
+    def append(self, trade: Trade):
+        """Record a trade, dropping the oldest one if the log is full."""
+        capacity = len(self._price)
+        if self._n == capacity and capacity < self._max_size:
+            self._grow()
+            capacity = len(self._price)
+        
+        if self._n < capacity:
+            i = (self._start + self._n) % capacity
+            self._n += 1
+        else:
+            i = self._start
+            self._start = (self._start + 1) % capacity
+        
+        self._time[i] = np.datetime64(trade.time, 'us')
+        self._type[i] = trade.type
+        self._price[i] = trade.price
+        self._amount[i] = trade.amount
+        self._value[i] = trade.value
+        self._pnl[i] = np.nan if trade.pnl is None else trade.pnl
+        self._total += 1
+    
+    def clear(self):
+        """Forget all trades (capacity is kept)."""
+        self._n = 0
+        self._start = 0
+        self._total = 0
+    
+    def tail(self, limit: int) -> List[Dict]:
+        """Return the most recent trades as dicts, newest first."""
+        count = min(limit, self._n)
+        # Slots of the newest `count` trades, newest first
+        window = (self._start + np.arange(self._n - 1, self._n - 1 - count, -1)) % len(self._price)
+        pnls = self._pnl[window].tolist()
+        return [
+            {
+                "time": t,
+                "type": kind,
+                "price": price,
+                "amount": amount,
+                "value": value,
+                "pnl": None if pnl != pnl else pnl,  # NaN check
+            }
+            for t, kind, price, amount, value, pnl in zip(
+                self._time[window].tolist(),
+                self._type[window].tolist(),
+                self._price[window].tolist(),
+                self._amount[window].tolist(),
+                self._value[window].tolist(),
+                pnls,
+            )
+        ]
+
+
+# GridTrader fields that the cached trigger levels depend on
+_LEVEL_INPUTS = frozenset({'reference_price', 'buy_threshold', 'sell_threshold'})
+
+
 @dataclass
 class GridTrader:
     """
@@ -37,26 +136,54 @@ class GridTrader:
     
     # Internal state
     reference_price: Optional[float] = None
-    trades: List[Trade] = field(default_factory=list)
+    trades: TradeLog = field(default_factory=TradeLog)
     total_realized_pnl: float = 0.0
-    buy_prices: List[float] = field(default_factory=list)  # Track buy prices for P&L
     initial_portfolio_value: Optional[float] = None
     
+    # Running sum/count of buy prices, so the average is O(1) per tick
+    _buy_sum: float = field(default=0.0, init=False, repr=False)
+    _buy_count: int = field(default=0, init=False, repr=False)
+    
+    # Absolute trigger prices derived from reference_price and thresholds,
+    # kept in sync by __setattr__. Without a reference price they form an
+    # empty band, so no tick is treated as quiet.
+    _buy_level: float = field(default=float('inf'), init=False, repr=False)
+    _sell_level: float = field(default=float('-inf'), init=False, repr=False)
+    
+    def __post_init__(self):
+        self._update_levels()
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Skip the assignments made by __init__ before the levels exist
+        if name in _LEVEL_INPUTS and '_sell_level' in self.__dict__:
+            self._update_levels()
+    
     def initialize(self, current_price: float):
         """Initialize the trader with current market price."""
         self.reference_price = current_price
         self.initial_portfolio_value = self.calculate_portfolio_value(current_price)
     
+    def _update_levels(self):
+        """Recompute the buy/sell trigger prices from the reference price."""
+        if self.reference_price is None:
+            self._buy_level = float('inf')
+            self._sell_level = float('-inf')
+            return
+        
+        self._buy_level = self.reference_price * (1 + self.buy_threshold / 100)
+        self._sell_level = self.reference_price * (1 + self.sell_threshold / 100)
+    
     def calculate_portfolio_value(self, current_price: float) -> float:
         """Calculate total portfolio value in USDT."""
         return self.usdt_balance + (self.btc_balance * current_price)
     
     def calculate_unrealized_pnl(self, current_price: float) -> float:
         """Calculate unrealized P&L based on current BTC holdings."""
-        if not self.buy_prices or self.btc_balance <= 0:
+        if not self._buy_count or self.btc_balance <= 0:
             return 0.0
         
-        avg_buy_price = sum(self.buy_prices) / len(self.buy_prices)
+        avg_buy_price = self._buy_sum / self._buy_count
         return self.btc_balance * (current_price - avg_buy_price)
     
     def calculate_total_pnl(self, current_price: float) -> float:
@@ -77,29 +204,42 @@ class GridTrader:
         Returns:
             Trade object if a trade was executed, None otherwise
         """
+        # Most ticks sit between the two levels: one chained compare and out
+        if self._buy_level < current_price < self._sell_level:
+            return None
+        
         if self.reference_price is None:
             self.initialize(current_price)
             return None
         
-        price_change_pct = ((current_price - self.reference_price) / self.reference_price) * 100
+        # Check for buy signal (price dropped below threshold)
+        if current_price <= self._buy_level:
+            return self._execute_buy(current_price)
         
-        trade = None
+        # Otherwise the price rose above the sell threshold
+        return self._execute_sell(current_price)
+    
+    def replay(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute buy/sell signals for a whole price series at once.
         
-        # Check for buy signal (price dropped below threshold)
-        if price_change_pct <= self.buy_threshold:
-            trade = self._execute_buy(current_price)
-            if trade:
-                # Update reference price after buy
-                self.reference_price = current_price
-        
-        # Check for sell signal (price rose above threshold)
-        elif price_change_pct >= self.sell_threshold:
-            trade = self._execute_sell(current_price)
-            if trade:
-                # Update reference price after sell
-                self.reference_price = current_price
+        Uses the kernel in _grid_numba, compiled with numba on the first
+        call (plain Python if numba is not installed). Starts from the
+        current reference price, or the first price if the trader is not
+        initialized. Balances and the trader's state are left untouched.
         
-        return trade
+        Args:
+            prices: Sequence of prices, oldest first
+        
+        Returns:
+            int8 array with +1 for a buy, -1 for a sell and 0 otherwise
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        if prices.size == 0:
+            return np.zeros(0, dtype=np.int8)
+        
+        ref0 = self.reference_price if self.reference_price is not None else prices[0]
+        return replay_signals(prices, float(ref0), float(self.buy_threshold), float(self.sell_threshold))
     
     def _execute_buy(self, price: float) -> Optional[Trade]:
         """Execute a simulated buy order."""
@@ -113,7 +253,11 @@ class GridTrader:
         self.btc_balance += btc_amount
         
         # Track buy price for P&L calculation
-        self.buy_prices.append(price)
+        self._buy_sum += price
+        self._buy_count += 1
+        
+        # Move the grid to the fill price
+        self.reference_price = price
         
         trade = Trade(
             time=datetime.now(),
@@ -138,8 +282,8 @@ class GridTrader:
         
         # Calculate P&L for this sell
         pnl = 0.0
-        if self.buy_prices:
-            avg_buy_price = sum(self.buy_prices) / len(self.buy_prices)
+        if self._buy_count:
+            avg_buy_price = self._buy_sum / self._buy_count
             pnl = btc_to_sell * (price - avg_buy_price)
             self.total_realized_pnl += pnl
         
@@ -150,7 +294,11 @@ class GridTrader:
         # Clear buy prices if we sold all BTC
         if self.btc_balance < 0.00000001:
             self.btc_balance = 0
-            self.buy_prices.clear()
+            self._buy_sum = 0.0
+            self._buy_count = 0
+        
+        # Move the grid to the fill price
+        self.reference_price = price
         
         trade = Trade(
             time=datetime.now(),
@@ -166,18 +314,7 @@ class GridTrader:
     
     def get_trade_history(self, limit: int = 10) -> List[Dict]:
         """Get recent trade history as list of dicts."""
-        recent_trades = self.trades[-limit:] if len(self.trades) > limit else self.trades
-        return [
-            {
-                "time": t.time,
-                "type": t.type,
-                "price": t.price,
-                "amount": t.amount,
-                "value": t.value,
-                "pnl": t.pnl,
-            }
-            for t in reversed(recent_trades)
-        ]
+        return self.trades.tail(limit)
     
     def get_stats(self, current_price: float) -> Dict:
         """Get current trading statistics."""
@@ -188,7 +325,7 @@ class GridTrader:
             "realized_pnl": self.total_realized_pnl,
             "unrealized_pnl": self.calculate_unrealized_pnl(current_price),
             "total_pnl": self.calculate_total_pnl(current_price),
-            "total_trades": len(self.trades),
+            "total_trades": self.trades.total,
             "reference_price": self.reference_price,
         }
     
@@ -198,7 +335,8 @@ class GridTrader:
         self.btc_balance = config.STARTING_BTC_BALANCE
         self.reference_price = None
         self.trades.clear()
-        self.buy_prices.clear()
+        self._buy_sum = 0.0
+        self._buy_count = 0
         self.total_realized_pnl = 0.0
         self.initial_portfolio_value = None
     
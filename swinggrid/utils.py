@@ -2,18 +2,62 @@
 AutoSwing Utility Functions
 """
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime
+from typing import List
+from functools import lru_cache
 from config import COLORS
 
+# plotly.graph_objects and the chart layouts are loaded on first use (see
+# _plotly) so importing this module stays cheap on a cold start
+go = None
+_CANDLE_LAYOUT = None
+_LINE_LAYOUT = None
+
+# Chart layouts are built once; each render only adds its trace and title
+_BASE_LAYOUT = dict(
+    title=dict(font=dict(size=20, color=COLORS['text'])),
+    xaxis_title="Time",
+    yaxis_title="Price (USDT)",
+    template="plotly_dark",
+    paper_bgcolor=COLORS['background'],
+    plot_bgcolor=COLORS['background'],
+    xaxis=dict(gridcolor='#333333', showgrid=True),
+    yaxis=dict(gridcolor='#333333', showgrid=True, side='right'),
+    margin=dict(l=10, r=60, t=50, b=40),
+    height=400,
+)
+
+# Translucent area fills for the line chart, keyed by trend color
+_RGBA_FILL = {
+    c: f"rgba({int(c[1:3], 16)}, {int(c[3:5], 16)}, {int(c[5:7], 16)}, 0.1)"
+    for c in (COLORS['profit'], COLORS['loss'], COLORS['primary'])
+}
+
+
+def _plotly():
+    """Import plotly.graph_objects and build the shared layouts on first call."""
+    global go, _CANDLE_LAYOUT, _LINE_LAYOUT
+    if go is None:
+        import plotly.graph_objects as graph_objects
+        _CANDLE_LAYOUT = graph_objects.Layout(
+            _BASE_LAYOUT,
+            xaxis=dict(gridcolor='#333333', showgrid=True, rangeslider=dict(visible=False)),
+        )
+        _LINE_LAYOUT = graph_objects.Layout(_BASE_LAYOUT)
+        go = graph_objects
+    return go
+
 
 def format_currency(value: float, symbol: str = "$") -> str:
     """Format a number as currency with proper formatting."""
-    if value >= 0:
-        return f"{symbol}{value:,.2f}"
-    else:
-        return f"-{symbol}{abs(value):,.2f}"
+    # Trade logs repeat the same cent amounts, so reuse formatted strings
+    return _format_cents(round(value, 2), symbol)
+
+
+@lru_cache(maxsize=1024)
+def _format_cents(value: float, symbol: str) -> str:
+    return f"{'-' if value < 0 else ''}{symbol}{abs(value):,.2f}"
 
 
 def format_btc(value: float) -> str:
@@ -23,8 +67,7 @@ def format_btc(value: float) -> str:
 
 def format_percentage(value: float) -> str:
     """Format a percentage with sign."""
-    sign = "+" if value >= 0 else ""
-    return f"{sign}{value:.2f}%"
+    return f"{'+' if value >= 0 else ''}{value:.2f}%"
 
 
 def calculate_percentage_change(old_value: float, new_value: float) -> float:
@@ -34,7 +77,7 @@ def calculate_percentage_change(old_value: float, new_value: float) -> float:
     return ((new_value - old_value) / old_value) * 100
 
 
-def create_candlestick_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> go.Figure:
+def create_candlestick_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> "go.Figure":
     """
     Create a Plotly candlestick chart from OHLCV data.
     
@@ -45,46 +88,29 @@ def create_candlestick_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> go.Fi
     Returns:
         Plotly Figure object
     """
-    fig = go.Figure(data=[go.Candlestick(
-        x=df['time'],
-        open=df['open'],
-        high=df['high'],
-        low=df['low'],
-        close=df['close'],
+    _plotly()
+    fig = go.Figure(layout=_CANDLE_LAYOUT)
+    fig.add_trace(go.Candlestick(
+        x=df['time'].to_numpy(),
+        open=df['open'].to_numpy(),
+        high=df['high'].to_numpy(),
+        low=df['low'].to_numpy(),
+        close=df['close'].to_numpy(),
         increasing_line_color=COLORS['profit'],
         decreasing_line_color=COLORS['loss'],
         increasing_fillcolor=COLORS['profit'],
         decreasing_fillcolor=COLORS['loss'],
-    )])
+    ))
     
     fig.update_layout(
-        title=dict(
-            text=f"📊 {title} Live Price",
-            font=dict(size=20, color=COLORS['text']),
-        ),
-        xaxis_title="Time",
-        yaxis_title="Price (USDT)",
-        template="plotly_dark",
-        paper_bgcolor=COLORS['background'],
-        plot_bgcolor=COLORS['background'],
-        xaxis=dict(
-            gridcolor='#333333',
-            showgrid=True,
-            rangeslider=dict(visible=False),
-        ),
-        yaxis=dict(
-            gridcolor='#333333',
-            showgrid=True,
-            side='right',
-        ),
-        margin=dict(l=10, r=60, t=50, b=40),
-        height=400,
+        title_text=f"📊 {title} Live Price",
+        uirevision=title,  # Keep zoom/pan across refreshes
     )
     
     return fig
 
 
-def create_price_line_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> go.Figure:
+def create_price_line_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> "go.Figure":
     """
     Create a Plotly line chart from price data.
     
@@ -95,50 +121,67 @@ def create_price_line_chart(df: pd.DataFrame, title: str = "BTC/USDT") -> go.Fig
     Returns:
         Plotly Figure object
     """
+    closes = df['close'].to_numpy()
+    
     # Determine color based on trend
-    if len(df) > 1:
-        color = COLORS['profit'] if df['close'].iloc[-1] >= df['close'].iloc[0] else COLORS['loss']
+    if len(closes) > 1:
+        color = COLORS['profit'] if closes[-1] >= closes[0] else COLORS['loss']
     else:
         color = COLORS['primary']
     
-    fig = go.Figure(data=[go.Scatter(
-        x=df['time'],
-        y=df['close'],
+    # WebGL trace: the browser draws long series on the GPU instead of SVG
+    _plotly()
+    fig = go.Figure(layout=_LINE_LAYOUT)
+    fig.add_trace(go.Scattergl(
+        x=df['time'].to_numpy(),
+        y=closes,
         mode='lines',
         line=dict(color=color, width=2),
         fill='tozeroy',
-        fillcolor=f"rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.1)",
-    )])
+        fillcolor=_RGBA_FILL[color],
+    ))
     
     fig.update_layout(
-        title=dict(
-            text=f"📈 {title} Price Trend",
-            font=dict(size=20, color=COLORS['text']),
-        ),
-        xaxis_title="Time",
-        yaxis_title="Price (USDT)",
-        template="plotly_dark",
-        paper_bgcolor=COLORS['background'],
-        plot_bgcolor=COLORS['background'],
-        xaxis=dict(gridcolor='#333333', showgrid=True),
-        yaxis=dict(gridcolor='#333333', showgrid=True, side='right'),
-        margin=dict(l=10, r=60, t=50, b=40),
-        height=400,
+        title_text=f"📈 {title} Price Trend",
+        uirevision=title,  # Keep zoom/pan across refreshes
     )
     
     return fig
 
 
-def format_trade_for_display(trade: dict) -> dict:
-    """Format a trade dictionary for display in the trade log."""
-    return {
-        "Time": trade.get("time", "").strftime("%H:%M:%S") if isinstance(trade.get("time"), datetime) else str(trade.get("time", "")),
-        "Type": trade.get("type", "").upper(),
-        "Price": format_currency(trade.get("price", 0)),
-        "Amount": f"{trade.get('amount', 0):.6f} BTC",
-        "Value": format_currency(trade.get("value", 0)),
-        "P&L": format_currency(trade.get("pnl", 0)) if trade.get("pnl") is not None else "—",
-    }
+def _format_currency_column(values: pd.Series, symbol: str = "$") -> pd.Series:
+    """Vectorized format_currency for a float Series."""
+    sign = pd.Series(np.where(values.round(2) < 0, "-", ""), index=values.index, dtype=object)
+    return sign + symbol + values.abs().map("{:,.2f}".format).astype(object)
+
+
+def format_trade_log(trades: List[dict]) -> pd.DataFrame:
+    """
+    Format a list of trade dicts for the trade log, one column at a time.
+    
+    Besides the display strings, 'P&L_num' carries the raw P&L (NaN for
+    buys) so styling can work on floats instead of re-parsing 'P&L'.
+    
+    Args:
+        trades: Trade dicts as returned by GridTrader.get_trade_history
+    
+    Returns:
+        DataFrame with Time, Type, Price, Amount, Value, P&L and P&L_num
+    """
+    raw = pd.DataFrame.from_records(
+        trades, columns=["time", "type", "price", "amount", "value", "pnl"]
+    )
+    pnl = raw["pnl"].astype(float)  # None -> NaN
+    
+    return pd.DataFrame({
+        "Time": pd.to_datetime(raw["time"]).dt.strftime("%H:%M:%S"),
+        "Type": raw["type"].str.upper(),
+        "Price": _format_currency_column(raw["price"].astype(float)),
+        "Amount": raw["amount"].astype(float).map("{:.6f} BTC".format),
+        "Value": _format_currency_column(raw["value"].astype(float)),
+        "P&L": _format_currency_column(pnl).where(pnl.notna(), "—"),
+        "P&L_num": pnl,
+    })
 
 
 def get_trend_indicator(current: float, previous: float) -> str:
@@ -2,20 +2,180 @@
 AutoSwing Trading Suite - Telegram Bot Controller
 A Telegram interface for managing crypto trading bots.
 
+Polling uses long-poll getUpdates restricted to messages and button
+callbacks. Updates queued while the bot was offline are skipped on
+start-up, so commands sent during downtime are dropped rather than
+replayed and must be resent.
+
 Author: AutoSwing Team
 License: MIT
 """
 
-import telebot
+import asyncio
+import itertools
+import json
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from telebot.async_telebot import AsyncTeleBot
 from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
 from decouple import config
 from exchange_client import CryptoExchange
 from trading_bots import GridTradingEngine, DollarCostAverager
 
-# Initialize Telegram bot and exchange connection
-telegram_bot = telebot.TeleBot(config("TELEGRAM_BOT_TOKEN"))
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    RedisError = Exception
+
+# Initialize Telegram bot and exchange connection. Handlers are coroutines,
+# so a slow exchange call in one chat never holds up updates for another;
+# blocking CCXT calls run in worker threads via asyncio.to_thread.
+telegram_bot = AsyncTeleBot(config("TELEGRAM_BOT_TOKEN"))
 crypto_exchange = CryptoExchange('binance')
 
+# Optional shared cache for /balance and /portfolio (set REDIS_URL). Each
+# value is also kept under "<key>:stale" for a while, to answer with when
+# the exchange is failing or rate-limiting us.
+BALANCE_REPLY_TTL = 5
+PORTFOLIO_REPLY_TTL = 10
+STALE_REPLY_TTL = 300
+REDIS_URL = config("REDIS_URL", default=None)
+RCACHE = aioredis.from_url(REDIS_URL, decode_responses=True) if REDIS_AVAILABLE and REDIS_URL else None
+
+# getUpdates long-poll settings: only the update types we handle, held
+# open up to POLL_TIMEOUT seconds so idle polling costs one request per
+# window. The HTTP timeout must outlast the long poll.
+POLL_TIMEOUT = 30
+POLL_REQUEST_TIMEOUT = POLL_TIMEOUT + 5
+ALLOWED_UPDATES = ['message', 'callback_query']
+
+# Grid/DCA placements run as background jobs so the command replies at
+# once. At most MAX_ACTIVE_JOBS place orders at a time; the rest queue.
+MAX_ACTIVE_JOBS = 4
+_job_slots = asyncio.Semaphore(MAX_ACTIVE_JOBS)
+_job_ids = itertools.count(1)
+
+# chat_id -> {job_id: (description, task)}. Finished jobs stay until
+# /status has reported them once; beyond MAX_FINISHED_JOBS per chat the
+# oldest finished ones are dropped, so chats that never ask stay bounded.
+MAX_FINISHED_JOBS = 20
+JOBS: Dict[int, Dict[int, Tuple[str, asyncio.Task]]] = {}
+
+
+def start_job(chat_id: int, description: str, work: Callable[[], List]) -> int:
+    """
+    Run a blocking order-placement callable as a background job.
+    
+    The chat gets a follow-up message when the job finishes.
+    
+    Args:
+        chat_id: Chat to report the result to
+        description: Short human-readable summary of the job
+        work: Zero-argument callable returning a list of OrderResult
+    
+    Returns:
+        The job id
+    """
+    job_id = next(_job_ids)
+    task = asyncio.create_task(_run_job(chat_id, job_id, description, work))
+    JOBS.setdefault(chat_id, {})[job_id] = (description, task)
+    return job_id
+
+
+async def _run_job(chat_id: int, job_id: int, description: str, work: Callable[[], List]) -> bool:
+    """
+    Execute a job in a worker thread and report how it went.
+    
+    Returns:
+        True if the orders were placed, False if the job raised
+    """
+    try:
+        try:
+            async with _job_slots:
+                results = await asyncio.to_thread(work)
+            placed = sum(1 for r in results if r.success)
+            text = f"✅ Job #{job_id} finished: {description}\n\n📦 {placed}/{len(results)} orders placed"
+            ok = True
+        except Exception as e:
+            text = f"❌ Job #{job_id} failed: {description}\n\n{str(e)}"
+            ok = False
+        try:
+            await telegram_bot.send_message(chat_id, text)
+        except Exception as e:
+            print(f"⚠️ Could not report job #{job_id} to chat {chat_id}: {e}")
+        return ok
+    finally:
+        _prune_finished_jobs(chat_id, job_id)
+
+
+def _prune_finished_jobs(chat_id: int, finishing_id: int):
+    """Keep at most MAX_FINISHED_JOBS finished jobs for a chat, dropping the oldest."""
+    jobs = JOBS.get(chat_id, {})
+    # The finishing job's own task is not marked done until it returns
+    finished = [
+        job_id for job_id, (_, task) in jobs.items()
+        if job_id == finishing_id or task.done()
+    ]
+    for job_id in finished[:-MAX_FINISHED_JOBS]:
+        del jobs[job_id]
+
+
+def _job_state(task: asyncio.Task) -> str:
+    """Short status label for a job's task."""
+    if not task.done():
+        return "⏳ running"
+    if task.cancelled():
+        return "🚫 cancelled"
+    if task.exception() is not None or not task.result():
+        return "❌ failed"
+    return "✅ done"
+
+
+async def cached(key: str, ttl: int, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Cache-aside lookup in Redis for JSON-serializable exchange data.
+    
+    Args:
+        key: Redis key
+        ttl: Seconds a fresh value is served from the cache
+        fetch: Zero-argument coroutine function performing the request
+    
+    Returns:
+        The cached or freshly fetched value; if fetch() fails, the last
+        good value (up to STALE_REPLY_TTL old) if there is one
+    """
+    if RCACHE is None:
+        return await fetch()
+    
+    try:
+        raw = await RCACHE.get(key)
+        if raw is not None:
+            return json.loads(raw)
+    except RedisError as e:
+        print(f"⚠️ Redis unavailable, fetching directly: {e}")
+        return await fetch()
+    
+    try:
+        value = await fetch()
+    except Exception:
+        stale = await RCACHE.get(f"{key}:stale")
+        if stale is not None:
+            return json.loads(stale)
+        raise
+    
+    payload = json.dumps(value)
+    try:
+        async with RCACHE.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, payload)
+            pipe.setex(f"{key}:stale", STALE_REPLY_TTL, payload)
+            await pipe.execute()
+    except RedisError as e:
+        print(f"⚠️ Could not cache {key}: {e}")
+    return value
+
 
 def create_main_keyboard():
     """Create the main interactive menu keyboard."""
@@ -34,91 +194,104 @@ def create_main_keyboard():
     return keyboard
 
 
+# The menu and guide texts never change, so they are built once
+_MAIN_KEYBOARD = create_main_keyboard()
+
+_WELCOME_TEXT = (
+    "🚀 *Welcome to AutoSwing Trading Suite!*\n\n"
+    "Your personal crypto trading assistant.\n"
+    "Select an option below to get started:"
+)
+
+_GRID_GUIDE = (
+    "📊 *Grid Trading Setup*\n\n"
+    "Place multiple buy orders at different price levels.\n\n"
+    "*Command:* `/grid <pair> <levels> <min_price> <max_price>`\n"
+    "*Example:* `/grid BTC/USDT 5 30000 35000`\n\n"
+    "This creates 5 buy orders from $30k to $35k."
+)
+
+_DCA_GUIDE = (
+    "💰 *Dollar Cost Averaging*\n\n"
+    "Spread your investment across multiple purchases.\n\n"
+    "*Command:* `/dca <pair> <intervals> <total_amount>`\n"
+    "*Example:* `/dca BTC/USDT 10 1000`\n\n"
+    "This invests $1000 across 10 separate buys."
+)
+
+_BALANCE_HINT = "💵 *Check Balance*\n\nUse: `/balance <SYMBOL>`\n\nExample: `/balance USDT`"
+
+_PORTFOLIO_HINT = "📈 Use `/portfolio` to view your total holdings in USDT."
+
+_HELP_TEXT = (
+    "❓ *Available Commands*\n\n"
+    "• `/grid` - Setup grid trading\n"
+    "• `/dca` - Setup DCA strategy\n"
+    "• `/balance` - Check token balance\n"
+    "• `/portfolio` - View total portfolio\n"
+    "• `/status` - Show running grid/DCA jobs\n"
+    "• `/start` - Show main menu"
+)
+
+
 @telegram_bot.message_handler(commands=['start'])
-def handle_start(message):
+async def handle_start(message):
     """Handle the /start command - welcome message."""
-    welcome_text = (
-        "🚀 *Welcome to AutoSwing Trading Suite!*\n\n"
-        "Your personal crypto trading assistant.\n"
-        "Select an option below to get started:"
-    )
-    telegram_bot.reply_to(
+    await telegram_bot.reply_to(
         message, 
-        welcome_text,
+        _WELCOME_TEXT,
         parse_mode='Markdown',
-        reply_markup=create_main_keyboard()
+        reply_markup=_MAIN_KEYBOARD
     )
 
 
+# Command argument patterns; "/cmd@BotName" (group chats) is accepted too
+_NUMBER = r'(\d+(?:\.\d+)?)'
+_GRID_RE = re.compile(rf'^/grid(?:@\w+)?\s+(\S+)\s+(\d+)\s+{_NUMBER}\s+{_NUMBER}\s*$')
+_DCA_RE = re.compile(rf'^/dca(?:@\w+)?\s+(\S+)\s+(\d+)\s+{_NUMBER}\s*$')
+_BALANCE_RE = re.compile(r'^/balance(?:@\w+)?\s+(\S+)\s*$')
+
+# Inline button -> (reply text, parse mode)
+_CALLBACK_REPLIES = {
+    "guide_grid": (_GRID_GUIDE, 'Markdown'),
+    "guide_dca": (_DCA_GUIDE, 'Markdown'),
+    "show_balance": (_BALANCE_HINT, 'Markdown'),
+    "show_portfolio": (_PORTFOLIO_HINT, None),
+    "show_help": (_HELP_TEXT, 'Markdown'),
+}
+
+
 @telegram_bot.callback_query_handler(func=lambda call: True)
-def handle_callback(call):
+async def handle_callback(call):
     """Handle all inline keyboard callbacks."""
-    chat_id = call.message.chat.id
-    
-    if call.data == "guide_grid":
-        guide_text = (
-            "📊 *Grid Trading Setup*\n\n"
-            "Place multiple buy orders at different price levels.\n\n"
-            "*Command:* `/grid <pair> <levels> <min_price> <max_price>`\n"
-            "*Example:* `/grid BTC/USDT 5 30000 35000`\n\n"
-            "This creates 5 buy orders from $30k to $35k."
-        )
-        telegram_bot.send_message(chat_id, guide_text, parse_mode='Markdown')
-        
-    elif call.data == "guide_dca":
-        guide_text = (
-            "💰 *Dollar Cost Averaging*\n\n"
-            "Spread your investment across multiple purchases.\n\n"
-            "*Command:* `/dca <pair> <intervals> <total_amount>`\n"
-            "*Example:* `/dca BTC/USDT 10 1000`\n\n"
-            "This invests $1000 across 10 separate buys."
-        )
-        telegram_bot.send_message(chat_id, guide_text, parse_mode='Markdown')
-        
-    elif call.data == "show_balance":
-        telegram_bot.send_message(
-            chat_id, 
-            "💵 *Check Balance*\n\nUse: `/balance <SYMBOL>`\n\nExample: `/balance USDT`",
-            parse_mode='Markdown'
-        )
-        
-    elif call.data == "show_portfolio":
-        telegram_bot.send_message(
-            chat_id, 
-            "📈 Use `/portfolio` to view your total holdings in USDT."
-        )
-        
-    elif call.data == "show_help":
-        help_text = (
-            "❓ *Available Commands*\n\n"
-            "• `/grid` - Setup grid trading\n"
-            "• `/dca` - Setup DCA strategy\n"
-            "• `/balance` - Check token balance\n"
-            "• `/portfolio` - View total portfolio\n"
-            "• `/start` - Show main menu"
-        )
-        telegram_bot.send_message(chat_id, help_text, parse_mode='Markdown')
+    # Stop the button's loading spinner straight away
+    await telegram_bot.answer_callback_query(call.id)
+    
+    reply = _CALLBACK_REPLIES.get(call.data)
+    if reply is not None:
+        text, parse_mode = reply
+        await telegram_bot.send_message(call.message.chat.id, text, parse_mode=parse_mode)
 
 
 @telegram_bot.message_handler(commands=['grid'])
-def handle_grid_command(message):
+async def handle_grid_command(message):
     """Handle grid trading setup command."""
-    params = message.text.split()
+    match = _GRID_RE.match(message.text)
     
-    if len(params) != 5:
+    if match is None:
         error_msg = (
             "⚠️ *Invalid Format*\n\n"
             "Use: `/grid <pair> <levels> <min> <max>`\n"
             "Example: `/grid BTC/USDT 5 30000 35000`"
         )
-        telegram_bot.reply_to(message, error_msg, parse_mode='Markdown')
+        await telegram_bot.reply_to(message, error_msg, parse_mode='Markdown')
         return
     
     try:
-        pair = params[1]
-        levels = int(params[2])
-        min_price = float(params[3])
-        max_price = float(params[4])
+        pair = match.group(1)
+        levels = int(match.group(2))
+        min_price = float(match.group(3))
+        max_price = float(match.group(4))
         
         grid_engine = GridTradingEngine(
             exchange=crypto_exchange,
@@ -127,34 +300,35 @@ def handle_grid_command(message):
             price_floor=min_price,
             price_ceiling=max_price
         )
-        grid_engine.place_grid_orders()
+        description = f"{pair} grid, {levels} orders from ${min_price:,.0f} to ${max_price:,.0f}"
+        job_id = start_job(message.chat.id, description, grid_engine.place_grid_orders)
         
-        telegram_bot.reply_to(
+        await telegram_bot.reply_to(
             message, 
-            f"✅ Grid orders placed!\n\n📊 {levels} orders from ${min_price:,.0f} to ${max_price:,.0f}"
+            f"⏳ Placing grid orders (job #{job_id})...\n\n📊 {levels} orders from ${min_price:,.0f} to ${max_price:,.0f}"
         )
     except Exception as e:
-        telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
+        await telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
 
 
 @telegram_bot.message_handler(commands=['dca'])
-def handle_dca_command(message):
+async def handle_dca_command(message):
     """Handle DCA setup command."""
-    params = message.text.split()
+    match = _DCA_RE.match(message.text)
     
-    if len(params) != 4:
+    if match is None:
         error_msg = (
             "⚠️ *Invalid Format*\n\n"
             "Use: `/dca <pair> <intervals> <amount>`\n"
             "Example: `/dca BTC/USDT 10 1000`"
         )
-        telegram_bot.reply_to(message, error_msg, parse_mode='Markdown')
+        await telegram_bot.reply_to(message, error_msg, parse_mode='Markdown')
         return
     
     try:
-        pair = params[1]
-        intervals = int(params[2])
-        total_amount = float(params[3])
+        pair = match.group(1)
+        intervals = int(match.group(2))
+        total_amount = float(match.group(3))
         
         dca_engine = DollarCostAverager(
             exchange=crypto_exchange,
@@ -162,59 +336,110 @@ def handle_dca_command(message):
             num_intervals=intervals,
             investment_amount=total_amount
         )
-        dca_engine.execute_purchases()
-        
         per_purchase = total_amount / intervals
-        telegram_bot.reply_to(
+        description = f"{pair} DCA, ${per_purchase:,.2f} × {intervals} purchases"
+        job_id = start_job(message.chat.id, description, dca_engine.execute_purchases)
+        
+        await telegram_bot.reply_to(
             message, 
-            f"✅ DCA orders placed!\n\n💰 ${per_purchase:,.2f} × {intervals} purchases"
+            f"⏳ Placing DCA orders (job #{job_id})...\n\n💰 ${per_purchase:,.2f} × {intervals} purchases"
         )
     except Exception as e:
-        telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
+        await telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
 
 
 @telegram_bot.message_handler(commands=['balance'])
-def handle_balance_command(message):
+async def handle_balance_command(message):
     """Handle balance check command."""
-    params = message.text.split()
+    match = _BALANCE_RE.match(message.text)
     
-    if len(params) != 2:
-        telegram_bot.reply_to(
+    if match is None:
+        await telegram_bot.reply_to(
             message, 
             "⚠️ Use: `/balance <SYMBOL>`\nExample: `/balance USDT`",
             parse_mode='Markdown'
         )
         return
     
-    token = params[1].upper()
+    token = match.group(1).upper()
     
     try:
-        balance_info = crypto_exchange.fetch_token_balance(token)
+        balance_info = await cached(
+            f"autoswing:balance:{crypto_exchange.exchange_id}:{token}",
+            BALANCE_REPLY_TTL,
+            lambda: asyncio.to_thread(crypto_exchange.fetch_token_balance, token)
+        )
         response = (
             f"💵 *{token} Balance*\n\n"
             f"Available: `{balance_info['available']}`\n"
             f"In Orders: `{balance_info['locked']}`\n"
             f"Total: `{balance_info['total']}`"
         )
-        telegram_bot.reply_to(message, response, parse_mode='Markdown')
+        await telegram_bot.reply_to(message, response, parse_mode='Markdown')
     except Exception as e:
-        telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
+        await telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
 
 
 @telegram_bot.message_handler(commands=['portfolio'])
-def handle_portfolio_command(message):
+async def handle_portfolio_command(message):
     """Handle portfolio value command."""
     try:
-        total_value = crypto_exchange.calculate_portfolio_usdt()
-        telegram_bot.reply_to(
+        total_value = await cached(
+            f"autoswing:portfolio:{crypto_exchange.exchange_id}",
+            PORTFOLIO_REPLY_TTL,
+            crypto_exchange.calculate_portfolio_usdt_async
+        )
+        await telegram_bot.reply_to(
             message, 
             f"📈 *Portfolio Value*\n\n💵 Total: `${total_value:,.2f} USDT`",
             parse_mode='Markdown'
         )
     except Exception as e:
-        telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
+        await telegram_bot.reply_to(message, f"❌ Error: {str(e)}")
+
+
+# Characters legacy Markdown treats as entity delimiters
+_MARKDOWN_SPECIAL = re.compile(r'([_*`\[])')
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape user-supplied text for Telegram's legacy Markdown parse mode."""
+    return _MARKDOWN_SPECIAL.sub(r'\\\1', text)
+
+
+@telegram_bot.message_handler(commands=['status'])
+async def handle_status_command(message):
+    """Handle job status command - list this chat's grid/DCA jobs."""
+    jobs = JOBS.get(message.chat.id)
+    if not jobs:
+        await telegram_bot.reply_to(message, "📭 No grid or DCA jobs.")
+        return
+    
+    lines = ["📋 *Jobs*\n"]
+    for job_id, (description, task) in sorted(jobs.items()):
+        lines.append(f"#{job_id} {_job_state(task)} - {_escape_markdown(description)}")
+        # Finished jobs are reported once, then forgotten
+        if task.done():
+            del jobs[job_id]
+    if not jobs:
+        del JOBS[message.chat.id]
+    
+    await telegram_bot.reply_to(message, "\n".join(lines), parse_mode='Markdown')
+
+
+async def main():
+    """Poll Telegram until interrupted, then close the exchange session."""
+    try:
+        await telegram_bot.infinity_polling(
+            skip_pending=True,
+            allowed_updates=ALLOWED_UPDATES,
+            timeout=POLL_TIMEOUT,
+            request_timeout=POLL_REQUEST_TIMEOUT,
+        )
+    finally:
+        await crypto_exchange.close_async()
 
 
 if __name__ == "__main__":
     print("🤖 AutoSwing Telegram Bot is running...")
-    telegram_bot.infinity_polling()
+    asyncio.run(main())
@@ -6,11 +6,16 @@ Author: AutoSwing Team
 License: MIT
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
+# Most orders a strategy keeps in flight at once
+MAX_PARALLEL_ORDERS = 8
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """Represents the result of an order placement."""
     success: bool
@@ -20,6 +25,82 @@ class OrderResult:
     error: Optional[str] = None
 
 
+class OrderLog:
+    """
+    Columnar (struct-of-arrays) store of OrderResults.
+    
+    Success flags, prices and quantities live in NumPy arrays, so
+    summary scans read one contiguous column instead of walking
+    objects; ids and errors stay in plain lists. Results are rebuilt on
+    demand with order(i), or all at once by snapshot(), which is cached
+    until the next extend().
+    """
+    
+    def __init__(self, capacity: int = 16):
+        capacity = max(1, capacity)
+        self._n = 0
+        self._success_count = 0  # Kept up to date by extend()
+        self._success = np.zeros(capacity, dtype=bool)
+        self._price = np.zeros(capacity, dtype=np.float64)
+        self._qty = np.zeros(capacity, dtype=np.float64)
+        self._order_id: List[Optional[str]] = []
+        self._error: List[Optional[str]] = []
+        self._snapshot: Optional[Tuple[OrderResult, ...]] = None
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def _reserve(self, extra: int):
+        """Make room for extra more rows (capacity at least doubles)."""
+        needed = self._n + extra
+        if needed <= len(self._success):
+            return
+        size = max(needed, len(self._success) * 2)
+        for name in ('_success', '_price', '_qty'):
+            column = getattr(self, name)
+            grown = np.zeros(size, dtype=column.dtype)
+            grown[:self._n] = column[:self._n]
+            setattr(self, name, grown)
+    
+    def extend(self, results: List[OrderResult]):
+        """Append order results."""
+        self._reserve(len(results))
+        rows = slice(self._n, self._n + len(results))
+        self._success[rows] = [r.success for r in results]
+        self._success_count += int(self._success[rows].sum())
+        # Market orders may report no price; stored as NaN, returned as None
+        self._price[rows] = [np.nan if r.price is None else r.price for r in results]
+        self._qty[rows] = [r.quantity for r in results]
+        self._order_id.extend(r.order_id for r in results)
+        self._error.extend(r.error for r in results)
+        self._n += len(results)
+        self._snapshot = None
+    
+    def success_count(self) -> int:
+        """Number of successful orders."""
+        return self._success_count
+    
+    def order(self, i: int) -> OrderResult:
+        """Rebuild the i-th stored result."""
+        if not -self._n <= i < self._n:
+            raise IndexError("order index out of range")
+        i %= self._n
+        price = float(self._price[i])
+        return OrderResult(
+            success=bool(self._success[i]),
+            price=None if price != price else price,  # NaN check
+            quantity=float(self._qty[i]),
+            order_id=self._order_id[i],
+            error=self._error[i],
+        )
+    
+    def snapshot(self) -> Tuple[OrderResult, ...]:
+        """All stored results, oldest first (built once per extend())."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self.order(i) for i in range(self._n))
+        return self._snapshot
+
+
 class GridTradingEngine:
     """
     Grid Trading Strategy Engine.
@@ -57,15 +138,30 @@ class GridTradingEngine:
         
         # Calculate spacing between grid levels
         self.level_spacing = (price_ceiling - price_floor) / num_levels
-        self.placed_orders: List[OrderResult] = []
+        self._orders = OrderLog(num_levels)
+        
+        # Grid levels as a float64 array (see calculate_grid_prices)
+        self._grid_prices_arr: Optional[np.ndarray] = None
+    
+    @property
+    def placed_orders(self) -> Tuple[OrderResult, ...]:
+        """Every grid order result so far, oldest first (read-only)."""
+        return self._orders.snapshot()
+    
+    def order(self, i: int) -> OrderResult:
+        """Result of the i-th grid order placed."""
+        return self._orders.order(i)
     
     def calculate_grid_prices(self) -> List[float]:
-        """Calculate all price levels for the grid."""
-        prices = []
-        for i in range(self.num_levels):
-            level_price = self.price_floor + (i * self.level_spacing)
-            prices.append(round(level_price, 2))
-        return prices
+        """
+        Calculate all price levels for the grid.
+        
+        The rounded levels are also kept in self._grid_prices_arr so
+        batch code can reuse them without rebuilding the list.
+        """
+        levels = self.price_floor + self.level_spacing * np.arange(self.num_levels)
+        self._grid_prices_arr = np.round(levels, 2)
+        return self._grid_prices_arr.tolist()
     
     def place_grid_orders(self) -> List[OrderResult]:
         """
@@ -75,34 +171,32 @@ class GridTradingEngine:
             List of OrderResult objects
         """
         grid_prices = self.calculate_grid_prices()
-        results = []
+        orders = [
+            {'type': 'limit', 'side': 'buy', 'amount': self.order_size, 'price': price}
+            for price in grid_prices
+        ]
         
-        for price in grid_prices:
-            try:
-                order = self.exchange.submit_order(
-                    pair=self.trading_pair,
-                    order_type='limit',
-                    side='buy',
-                    quantity=self.order_size,
-                    price=price
-                )
-                result = OrderResult(
-                    success=True,
+        # One batch call where the exchange supports it
+        responses = self.exchange.submit_orders_batch(self.trading_pair, orders)
+        
+        results: List[Optional[OrderResult]] = [None] * len(grid_prices)
+        for i, (price, response) in enumerate(zip(grid_prices, responses)):
+            if isinstance(response, Exception):
+                results[i] = OrderResult(
+                    success=False,
                     price=price,
                     quantity=self.order_size,
-                    order_id=order.get('id')
+                    error=str(response)
                 )
-            except Exception as e:
-                result = OrderResult(
-                    success=False,
+            else:
+                results[i] = OrderResult(
+                    success=True,
                     price=price,
                     quantity=self.order_size,
-                    error=str(e)
+                    order_id=response.get('id')
                 )
-            
-            results.append(result)
-            self.placed_orders.append(result)
         
+        self._orders.extend(results)
         return results
     
     def get_summary(self) -> Dict:
@@ -112,7 +206,7 @@ class GridTradingEngine:
             'levels': self.num_levels,
             'price_range': f"${self.price_floor:,.2f} - ${self.price_ceiling:,.2f}",
             'spacing': f"${self.level_spacing:,.2f}",
-            'orders_placed': len([o for o in self.placed_orders if o.success])
+            'orders_placed': self._orders.success_count()
         }
 
 
@@ -147,42 +241,55 @@ class DollarCostAverager:
         
         # Calculate amount per purchase
         self.amount_per_purchase = investment_amount / num_intervals
-        self.executed_purchases: List[OrderResult] = []
+        self._purchases = OrderLog(num_intervals)
+    
+    @property
+    def executed_purchases(self) -> Tuple[OrderResult, ...]:
+        """Every purchase result so far, oldest first (read-only)."""
+        return self._purchases.snapshot()
+    
+    def order(self, i: int) -> OrderResult:
+        """Result of the i-th purchase."""
+        return self._purchases.order(i)
+    
+    def _one_purchase(self) -> OrderResult:
+        """Submit a single DCA market buy."""
+        try:
+            order = self.exchange.submit_order(
+                pair=self.trading_pair,
+                order_type='market',
+                side='buy',
+                quantity=self.amount_per_purchase
+            )
+            return OrderResult(
+                success=True,
+                price=order.get('price', 0),
+                quantity=self.amount_per_purchase,
+                order_id=order.get('id')
+            )
+        except Exception as e:
+            return OrderResult(
+                success=False,
+                price=0,
+                quantity=self.amount_per_purchase,
+                error=str(e)
+            )
     
     def execute_purchases(self) -> List[OrderResult]:
         """
         Execute all DCA purchases.
         
+        The purchases are independent, so up to MAX_PARALLEL_ORDERS are
+        submitted concurrently instead of waiting on each round trip.
+        
         Returns:
             List of OrderResult objects
         """
-        results = []
-        
-        for interval in range(self.num_intervals):
-            try:
-                order = self.exchange.submit_order(
-                    pair=self.trading_pair,
-                    order_type='market',
-                    side='buy',
-                    quantity=self.amount_per_purchase
-                )
-                result = OrderResult(
-                    success=True,
-                    price=order.get('price', 0),
-                    quantity=self.amount_per_purchase,
-                    order_id=order.get('id')
-                )
-            except Exception as e:
-                result = OrderResult(
-                    success=False,
-                    price=0,
-                    quantity=self.amount_per_purchase,
-                    error=str(e)
-                )
-            
-            results.append(result)
-            self.executed_purchases.append(result)
+        workers = max(1, min(self.num_intervals, MAX_PARALLEL_ORDERS))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda _: self._one_purchase(), range(self.num_intervals)))
         
+        self._purchases.extend(results)
         return results
     
     def get_summary(self) -> Dict:
@@ -192,5 +299,5 @@ class DollarCostAverager:
             'intervals': self.num_intervals,
             'total_investment': f"${self.investment_amount:,.2f}",
             'per_purchase': f"${self.amount_per_purchase:,.2f}",
-            'purchases_completed': len([p for p in self.executed_purchases if p.success])
+            'purchases_completed': self._purchases.success_count()
         }